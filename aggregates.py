@@ -0,0 +1,121 @@
+import json
+import re
+import threading
+from collections import Counter
+
+from dates import parse_date
+
+# Dimensi yang dihitung untuk dashboard
+DIMENSIONS = ("kategori", "site", "tanggal", "keyword")
+
+_SECTOR_RE = re.compile(r"\s*([A-U])(?![A-Za-z])")
+
+
+def sector(kategori: str) -> str:
+    """Huruf sektor KBLI dari label classifier ("C", "C. 10.", "M,N" → "C"/"M"); lainnya "?"."""
+    m = _SECTOR_RE.match(kategori or "")
+    return m.group(1) if m else "?"
+
+
+def day(tanggal: str) -> str:
+    d = parse_date(tanggal or "")
+    return d.isoformat() if d else "unknown"
+
+
+class Aggregates:
+    """
+    Counter artikel per kategori (sektor), site, tanggal, keyword, dan sektor × tanggal.
+    Artikel dihitung sekali per link (`add()`), keyword sekali per pasangan link × keyword
+    (`add_keyword()`); keduanya O(1) per artikel. `snapshot_json()` di-cache per versi
+    sehingga endpoint dashboard tidak perlu membaca ulang baris job mana pun.
+
+    Dengan `loader` (callable ➜ (rows, keywords), lihat `rebuild()`) histori baru dimuat
+    saat snapshot pertama diminta, bukan saat start. Sebelum itu `add*()` diabaikan karena
+    loader akan membaca artikel tersebut dari sumbernya; tahan `write_lock` selama menulis
+    ke sumber + counter agar muatan histori tidak menyelip di antaranya.
+    """
+
+    def __init__(self, loader=None):
+        self._lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self._loader = loader
+        self._loaded = loader is None
+        self._reset()
+
+    def _reset(self):
+        self.total = 0
+        self.counts = {dim: Counter() for dim in DIMENSIONS}
+        self.sector_by_day = Counter()     # (kategori, tanggal) ➜ jumlah
+        self._version = 0
+        self._cached = (-1, "")
+
+    def add(self, kategori: str, site: str, tanggal: str):
+        """Satu artikel baru (link belum pernah dihitung)."""
+        key = (sector(kategori), site, day(tanggal))
+        with self._lock:
+            if not self._loaded:
+                return
+            for dim, value in zip(DIMENSIONS, key):
+                self.counts[dim][value] += 1
+            self.sector_by_day[(key[0], key[2])] += 1
+            self.total += 1
+            self._version += 1
+
+    def add_keyword(self, keyword: str):
+        """Satu pasangan link × keyword baru, juga untuk artikel lama yang ditemukan keyword lain."""
+        with self._lock:
+            if not self._loaded:
+                return
+            self.counts["keyword"][keyword] += 1
+            self._version += 1
+
+    def rebuild(self, rows, keywords=()):
+        """
+        Hitung ulang semua counter sekaligus dari iterable (kategori, site, tanggal) per artikel
+        dan keyword per pasangan link × keyword, mis. saat histori di-import ulang.
+        Diproses per kolom dengan Counter, bukan per baris.
+        """
+        rows = list(rows)
+        if rows:
+            kategori, site, tanggal = zip(*rows)
+            columns = (list(map(sector, kategori)), site, list(map(day, tanggal)))
+        else:
+            columns = ((), (), ())
+        counts = {dim: Counter(col) for dim, col in zip(DIMENSIONS, columns)}
+        counts["keyword"] = Counter(keywords)
+        sector_by_day = Counter(zip(columns[0], columns[2]))
+        with self._lock:
+            self.counts = counts
+            self.sector_by_day = sector_by_day
+            self.total = len(rows)
+            self._loaded = True
+            self._version += 1
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self.write_lock:
+            if not self._loaded:
+                self.rebuild(*self._loader())
+
+    def snapshot(self) -> dict:
+        self._ensure_loaded()
+        with self._lock:
+            per_day: dict[str, dict] = {}
+            for (kat, tgl), n in self.sector_by_day.items():
+                per_day.setdefault(tgl, {})[kat] = n
+            return {
+                "total": self.total,
+                **{dim: dict(self.counts[dim].most_common()) for dim in DIMENSIONS},
+                "kategori_per_tanggal": dict(sorted(per_day.items())),
+            }
+
+    def snapshot_json(self) -> str:
+        """JSON snapshot; hanya dibangun ulang jika ada artikel baru sejak panggilan terakhir."""
+        self._ensure_loaded()
+        version, body = self._cached
+        if version != self._version:
+            version = self._version
+            body = json.dumps(self.snapshot(), ensure_ascii=False)
+            self._cached = (version, body)
+        return body
@@ -1,32 +1,211 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, Response
-from scrapper import scrape
-from summarizer import summarize
-from classifier import classify
-import threading, uuid
-import csv
+from flask import Flask, render_template, request, jsonify, redirect, url_for, Response, send_file
+from article import Article, VIEW_FIELDS
+from dates import sort_by_date, to_date
+from search_index import SearchIndex
+from aggregates import Aggregates
+from payload import Payload, negotiate
+from precrawl import Precrawler, WATCHLIST, WARM_GRACE
+from checkpoint import JobCheckpoint, MAX_RESUME_ATTEMPTS, article_key, pending
+from profiling import JobProfiler, NULL_PROFILER, PROFILE_FILES
+import threading, uuid, time, os, queue
+import csv, json
 from io import StringIO
 
 app = Flask(__name__)
-TASKS: dict[str, dict] = {}  # task_id ➜ {"total":N, "done":0, "rows":[], "finished":bool}
+TASKS: dict[str, dict] = {}  # task_id ➜ {"total":N, "done":0, "rows":[Article], "finished":bool}
+INDEX = SearchIndex()         # semua artikel yang sudah diperkaya, untuk /search
+AGGREGATES = Aggregates(INDEX.aggregate_rows)   # counter dashboard; histori dimuat saat /stats pertama
+STREAM_SUMMARIES = os.environ.get("STREAM_SUMMARIES", "1") == "1"   # ringkasan parsial di /status
 
 # ──────────────── Background worker ────────────────
-def worker(task_id: str, keyword: str, max_articles: int):
-    art_list = scrape(keyword, max_articles)
-    TASKS[task_id]["total"] = len(art_list)
+def worker(task_id: str, keyword: str, max_articles: int, since=None, until=None,
+           ckpt: JobCheckpoint | None = None, profiler: JobProfiler | None = None):
+    # import berat (bs4, lxml, requests, groq) ditunda sampai job pertama
+    from scrapper import scrape
+    from enrich import enrich
 
-    for art in art_list:
-        isi = art.get("content", "").strip()
-        if len(isi) < 30:
-            art["summary"] = "Teks kosong"
-            art["kategori"] = "R"
-        else:
-            art["summary"] = summarize(isi)
-            art["kategori"] = classify(art["summary"])
+    task = TASKS[task_id]
+    span = (profiler or NULL_PROFILER).span
+    # dengan checkpoint: site yang sudah selesai & artikel yang sudah diringkas tidak diulang
+    done_sites = ckpt.site_results() if ckpt else {}
+    enriched = ckpt.enriched() if ckpt else {}
 
-        TASKS[task_id]["rows"].append(art)
-        TASKS[task_id]["done"] += 1
+    # artikel diperkaya begitu site-nya selesai di-scrape, tanpa menunggu semua site
+    batches: queue.Queue = queue.Queue()
+    for rows in done_sites.values():
+        batches.put(rows)
+    failure = []
 
-    TASKS[task_id]["finished"] = True
+    def site_done(name, rows):
+        if ckpt:
+            ckpt.save_site(name, rows)
+        batches.put(rows)
+
+    def run_scrape():
+        try:
+            with span("scrape", profile=True):
+                scrape(keyword, max_articles, since=since, until=until,
+                       done_sites=done_sites, on_site_done=site_done, profiler=profiler)
+        except Exception as e:
+            failure.append(e)
+        finally:
+            batches.put(None)
+
+    threading.Thread(target=run_scrape, daemon=True).start()
+
+    while (rows := batches.get()) is not None:
+        art_list = [Article.from_dict(a) for a in rows]
+        del rows
+        task["total"] += len(art_list)
+
+        for art in art_list:
+            with span("article", cat="article", site=art.site, title=art.title):
+                isi = art.content.strip()
+                prev = enriched.get(article_key(art))
+                # baris sudah tampil di /status selagi ringkasannya di-stream
+                task["rows"].append(art)
+                if prev:
+                    art.summary = prev["summary"]
+                    art.kategori = prev["kategori"]
+                elif len(isi) < 30:
+                    art.summary = "Teks kosong"
+                    art.kategori = "R"
+                else:
+                    def on_token(partial, art=art):
+                        art.summary = partial
+                    with span("enrich", cat="llm", chars=len(isi)):
+                        art.summary, art.kategori = enrich(isi, on_token=on_token if STREAM_SUMMARIES else None)
+                if ckpt and not prev:
+                    ckpt.save_enriched(art)
+
+                with AGGREGATES.write_lock:
+                    try:
+                        is_new, new_keyword = INDEX.add(art, keyword)
+                    except Exception as e:
+                        print(f"⚠️ Gagal menyimpan ke index: {e}")
+                        is_new = new_keyword = True
+                    # artikel yang di-crawl ulang tidak dihitung dua kali; keyword baru tetap dihitung
+                    if is_new:
+                        AGGREGATES.add(art.kategori, art.site, art.tanggal)
+                    if new_keyword:
+                        AGGREGATES.add_keyword(keyword)
+
+                # isi lengkap tidak dipakai lagi setelah ringkasan → lepas dari RAM
+                art.release_content()
+            task["done"] += 1
+
+    if failure:   # checkpoint disimpan agar job dilanjutkan setelah restart
+        fail_task(task_id, f"Scrape gagal: {failure[0]}")
+        return
+    task["finished"] = True
+    if ckpt:
+        ckpt.finish()
+
+def fail_task(task_id: str, error):
+    """Tandai task selesai dengan `error`, supaya /progress berhenti polling dan menampilkannya."""
+    print(f"❌ Task {task_id} gagal: {error}")
+    task = TASKS.get(task_id)
+    if task is not None:
+        task["error"] = str(error)
+        task["finished"] = True
+
+def guarded(target, task_id: str, *args, **kwargs):
+    """Target thread job: exception tak terduga menggagalkan task, bukan menggantungkannya."""
+    try:
+        target(task_id, *args, **kwargs)
+    except Exception as e:
+        fail_task(task_id, e)
+
+def profiled_worker(task_id: str, *args, profiler: JobProfiler):
+    """worker() di bawah profiler; hasil disimpan ke PROFILE_DIR walau job gagal."""
+    try:
+        with profiler.span("job", profile=True, task_id=task_id):
+            worker(task_id, *args, profiler=profiler)
+    finally:
+        profiler.save()
+        TASKS[task_id]["profile_ready"] = True
+
+def new_task(**extra) -> str:
+    task_id = uuid.uuid4().hex[:8]
+    TASKS[task_id] = {"total": 0, "done": 0, "rows": [], "finished": False, **extra}
+    return task_id
+
+def launch_worker(task_id: str, args: tuple, profile: bool = False):
+    """Jalankan worker di thread baru; dengan `profile` lewat profiled_worker()."""
+    if profile:
+        TASKS[task_id]["profile"] = True
+        target, kwargs = profiled_worker, {"profiler": JobProfiler(task_id)}
+    else:
+        target, kwargs = worker, {}
+    t = threading.Thread(target=guarded, args=(target, task_id, *args), kwargs=kwargs,
+                         name=f"job-{task_id}", daemon=True)
+    t.start()
+
+def start_task(keyword: str, max_articles: int, since=None, until=None, profile: bool = False) -> str:
+    task_id = new_task()
+    ckpt = JobCheckpoint.create(task_id, keyword=keyword, max_articles=max_articles,
+                                since=since.isoformat() if since else None,
+                                until=until.isoformat() if until else None, profile=profile)
+
+    launch_worker(task_id, (keyword, max_articles, since, until, ckpt), profile)
+    return task_id
+
+def resume_pending_tasks():
+    """Lanjutkan job yang terputus (crash/restart) dari checkpoint terakhir, dengan task_id yang sama."""
+    for ckpt in pending():
+        if ckpt.task_id in TASKS:
+            continue
+        try:
+            params = ckpt.params()
+            resumes = ckpt.record_resume()
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Checkpoint {ckpt.task_id} tidak bisa dibaca: {e}")
+            continue
+        if resumes > MAX_RESUME_ATTEMPTS:   # job yang selalu gagal tidak diulang tiap restart
+            print(f"✗ Task {ckpt.task_id} ({params['keyword']}) menyerah setelah "
+                  f"{MAX_RESUME_ATTEMPTS} kali dilanjutkan, checkpoint dihapus")
+            ckpt.finish()
+            continue
+        TASKS[ckpt.task_id] = {"total": 0, "done": 0, "rows": [], "finished": False}
+        print(f"↻ Melanjutkan task {ckpt.task_id} ({params['keyword']})")
+        launch_worker(ckpt.task_id, (params["keyword"], params["max_articles"],
+                                     to_date(params.get("since")), to_date(params.get("until")), ckpt),
+                      params.get("profile", False))
+
+# ──────────────── Pre-crawl watchlist ────────────────
+def precrawl_job(keyword: str, max_articles: int) -> str:
+    # dijalankan langsung di thread precrawler (prioritas rendah), bukan thread baru
+    task_id = new_task(precrawl=True)
+    guarded(worker, task_id, keyword, max_articles)
+    error = TASKS[task_id].get("error")
+    if error:   # hasil gagal tidak dijadikan hasil hangat dan tidak disimpan di TASKS
+        TASKS.pop(task_id, None)
+        raise RuntimeError(error)
+    return task_id
+
+def user_jobs_running() -> bool:
+    # task gagal (finished + error) dihitung idle, agar precrawler tidak menunggu selamanya
+    return any(not t["finished"] and not t.get("error") and not t.get("precrawl")
+               for t in list(TASKS.values()))
+
+def discard_warm(task_id: str) -> bool:
+    """Buang hasil hangat lama, kecuali masih diakses dalam WARM_GRACE detik terakhir."""
+    task = TASKS.get(task_id)
+    if task and time.time() - task.get("accessed", 0) < WARM_GRACE:
+        return False
+    TASKS.pop(task_id, None)
+    return True
+
+PRECRAWLER = Precrawler(WATCHLIST, precrawl_job, user_jobs_running, discard_job=discard_warm)
+
+def start_background():
+    """
+    Lanjutkan checkpoint + mulai precrawler. Tidak dijalankan saat `import app` (tool/tes
+    tidak boleh memicu job LLM berbayar); `python app.py` memanggilnya, server lain
+    memanggilnya sekali per proses, mis. hook `post_worker_init` gunicorn.
+    """
+    resume_pending_tasks()
+    PRECRAWLER.start()
 
 # ──────────────── Routes ────────────────
 @app.route("/", methods=["GET", "POST"])
@@ -35,61 +214,150 @@ def index():
         keyword = request.form.get("keyword", "").strip()
         max_raw = request.form.get("max_articles", "20").strip()
         max_art = int(max_raw) if max_raw.isdigit() else 20
+        since = to_date(request.form.get("since", "").strip())
+        until = to_date(request.form.get("until", "").strip())
+        profile = request.form.get("profile") == "1"
 
-        task_id = uuid.uuid4().hex[:8]
-        TASKS[task_id] = {"total": 0, "done": 0, "rows": [], "finished": False}
-
-        t = threading.Thread(target=worker, args=(task_id, keyword, max_art), daemon=True)
-        t.start()
+        # kata kunci watchlist: pakai hasil pre-crawl yang sudah hangat
+        warm_id = PRECRAWLER.lookup(keyword, max_art) if not (since or until or profile) else None
+        if warm_id in TASKS:
+            TASKS[warm_id]["accessed"] = time.time()
+            return redirect(url_for("progress", task_id=warm_id))
 
+        task_id = start_task(keyword, max_art, since, until, profile)
         return redirect(url_for("progress", task_id=task_id))
 
     return render_template("index.html")
 
+@app.route("/search", methods=["GET", "POST"])
+def search():
+    """
+    Cari dari index lokal: q, since, until, kategori, site, limit (query string atau form).
+    POST dengan live=1 juga menjalankan crawl live untuk artikel yang lebih baru dari isi
+    index; GET tidak pernah memulai crawl (bisa di-prefetch/di-crawl bot tanpa biaya).
+    """
+    args = request.values
+    q = args.get("q", "").strip()
+    since = to_date(args.get("since", "").strip())
+    until = to_date(args.get("until", "").strip())
+    limit_raw = args.get("limit", "50").strip()
+    limit = min(int(limit_raw), 500) if limit_raw.isdigit() else 50
+
+    start = time.perf_counter()
+    results = INDEX.search(q, since, until, args.get("kategori"), args.get("site"), limit)
+    payload = {"query": q, "count": len(results), "results": results,
+               "took_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+    if q and request.method == "POST" and args.get("live") == "1":
+        newest = INDEX.latest_date(q)
+        live_since = max(filter(None, (since, newest)), default=None)
+        max_raw = args.get("max_articles", "20").strip()
+        task_id = start_task(q, int(max_raw) if max_raw.isdigit() else 20, live_since, until)
+        payload["live_task"] = {"task_id": task_id, "since": live_since.isoformat() if live_since else None,
+                                "progress": url_for("progress", task_id=task_id)}
+
+    return jsonify(payload)
+
+@app.route("/stats")
+def stats():
+    """Jumlah artikel per kategori, site, tanggal, keyword dan kategori × tanggal."""
+    return Response(AGGREGATES.snapshot_json(), mimetype="application/json")
+
 @app.route("/progress/<task_id>")
 def progress(task_id):
     if task_id not in TASKS:
         return "Task not found", 404
-    return render_template("progress.html", task_id=task_id)
+    TASKS[task_id]["accessed"] = time.time()
+    return render_template("progress.html", task_id=task_id, profile=TASKS[task_id].get("profile", False))
+
+def task_payload(data: dict, kind: str, build) -> tuple[Payload, bool]:
+    """
+    Payload `kind` untuk task; untuk task yang sudah selesai hasil serialisasi di-cache
+    sekali di task (isinya tidak akan berubah lagi). Mengembalikan (payload, cacheable).
+    """
+    if not data["finished"]:
+        return Payload(build()), False
+    cache = data.setdefault("payloads", {})
+    if kind not in cache:
+        cache[kind] = Payload(build())
+    return cache[kind], True
+
+def send_payload(payload: Payload, mimetype: str, cacheable: bool, headers=None) -> Response:
+    """Kirim payload dengan gzip/br sesuai Accept-Encoding; ETag + 304 jika `cacheable`."""
+    encoding = negotiate(request.accept_encodings, len(payload.body))
+    resp = Response(mimetype=mimetype, headers=headers)
+    resp.vary.add("Accept-Encoding")
+    if cacheable:
+        etag = payload.etag_for(encoding)
+        resp.set_etag(etag)
+        resp.headers["Cache-Control"] = "no-cache"   # boleh disimpan, wajib revalidasi
+        if request.if_none_match.contains(etag):
+            resp.status_code = 304
+            return resp
+    resp.set_data(payload.encoded(encoding))
+    if encoding:
+        resp.headers["Content-Encoding"] = encoding
+    return resp
 
 @app.route("/status/<task_id>")
 def status(task_id):
     data = TASKS.get(task_id)
     if not data:
         return jsonify({"error": "task not found"}), 404
-    return jsonify({
-        "total": data["total"],
-        "done": data["done"],
-        "rows": data["rows"],
-        "finished": data["finished"]
-    })
+    data["accessed"] = time.time()   # hasil hangat lama tidak dibuang selagi di-poll
+
+    def build() -> bytes:
+        return json.dumps({
+            "total": data["total"],
+            "done": data["done"],
+            "rows": [art.view() for art in data["rows"]],
+            "finished": data["finished"],
+            "error": data.get("error")
+        }, ensure_ascii=False).encode("utf-8")
+
+    payload, cacheable = task_payload(data, "status", build)
+    return send_payload(payload, "application/json", cacheable)
 
 @app.route("/download/<task_id>")
 def download(task_id):
     data = TASKS.get(task_id)
     if not data or not data.get("finished"):
         return "Data belum siap atau task tidak ditemukan.", 404
+    data["accessed"] = time.time()
+
+    def build() -> bytes:
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(VIEW_FIELDS)
 
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["site", "tanggal", "title", "summary", "kategori", "link"])
+        for art in sort_by_date(data["rows"]):   # terbaru dulu, tanpa tanggal di akhir
+            writer.writerow([getattr(art, name) for name in VIEW_FIELDS])
 
-    for item in data["rows"]:
-        writer.writerow([
-            item.get("site", ""),
-            item.get("tanggal", ""),
-            item.get("title", ""),
-            item.get("summary", ""),
-            item.get("kategori", ""),
-            item.get("link", "")
-        ])
+        return output.getvalue().encode("utf-8")
 
-    output.seek(0)
-    return Response(output.getvalue(), mimetype="text/csv",
-                    headers={"Content-Disposition": f"attachment;filename=berita_{task_id}.csv"})
+    payload, cacheable = task_payload(data, "download", build)
+    return send_payload(payload, "text/csv", cacheable,
+                        headers={"Content-Disposition": f"attachment;filename=berita_{task_id}.csv"})
+
+@app.route("/profile/<task_id>")
+def profile(task_id):
+    """Hasil profiling task: ?file=report.txt (default), trace.json atau cpu.pstats."""
+    data = TASKS.get(task_id)
+    if not data or not data.get("profile_ready"):
+        return "Profil belum siap atau task tidak diprofil.", 404
+    name = request.args.get("file", "report.txt")
+    if name not in PROFILE_FILES:
+        return f"File profil tidak dikenal: {name}", 404
+    path = os.path.join(JobProfiler(task_id).dir, name)
+    if not os.path.exists(path):
+        return "File profil tidak ada.", 404
+    return send_file(os.path.abspath(path), mimetype=PROFILE_FILES[name],
+                     as_attachment=name != "report.txt", download_name=f"profil_{task_id}_{name}")
 
 if __name__ == "__main__":
-    import os
     port = int(os.environ.get("PORT", 5000))
+    # dengan reloader, hanya proses anak (yang melayani request) menjalankan job latar
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background()
     app.run(host="0.0.0.0", port=port, debug=True)
 
@@ -0,0 +1,49 @@
+import sys
+
+from dates import parse_date
+
+# Field yang dikirim ke /status dan ditulis ke CSV (tanpa `content`)
+VIEW_FIELDS = ("site", "tanggal", "title", "summary", "kategori", "link")
+
+
+class Article:
+    """
+    Record artikel ringkas pengganti dict {'site','tanggal','title','content','link'}.
+    Nilai `site` di-intern (hanya ada belasan site), dan `content` dilepas dari RAM
+    dengan `release_content()` begitu ringkasannya selesai.
+    """
+
+    __slots__ = ("site", "tanggal", "title", "link", "summary", "kategori", "_content")
+
+    def __init__(self, site: str, tanggal: str, title: str, content: str, link: str,
+                 summary: str = "", kategori: str = ""):
+        self.site = sys.intern(site)
+        self.tanggal = tanggal
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.kategori = kategori
+        self._content = content
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Article":
+        return cls(d.get("site", ""), d.get("tanggal", ""), d.get("title", ""),
+                   d.get("content", ""), d.get("link", ""),
+                   d.get("summary", ""), d.get("kategori", ""))
+
+    @property
+    def date(self):
+        """`tanggal` sebagai `datetime.date` (None jika tidak bisa di-parse), untuk sort/filter."""
+        return parse_date(self.tanggal)
+
+    @property
+    def content(self) -> str:
+        return self._content or ""
+
+    def release_content(self):
+        """Lepas `content` dari RAM; hanya `view()` yang dipakai setelah ringkasan selesai."""
+        self._content = None
+
+    def view(self) -> dict:
+        """Dict ringan untuk JSON/CSV (tanpa `content`)."""
+        return {name: getattr(self, name) for name in VIEW_FIELDS}
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from fetch import CHUNK_SIZE, MAX_FETCH_BYTES, BodyBuffer, check_headers
+
+# Status yang di-retry, sama seperti Retry di scrapper.create_session()
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class AsyncResponse:
+    """
+    Response minimal yang meniru `requests.Response` (status_code, headers, text,
+    json(), raise_for_status()) supaya fungsi scrape_* bisa dipakai tanpa perubahan.
+    """
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes, encoding: str | None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class AsyncSession:
+    """
+    Transport asyncio (httpx, HTTP/2 jika server mendukung) dengan facade sinkron `get()`.
+
+    Satu event loop di thread terpisah melayani semua request: koneksi keep-alive di-pool
+    (HTTP/2 memultipleks banyak request di satu koneksi per host, jadi DNS hanya di-resolve
+    saat koneksi baru dibuka) dan jumlah request bersamaan per host dibatasi `limit_per_host`.
+    `get_many()` mengirim banyak GET sekaligus lewat `asyncio.gather`, sehingga ratusan
+    request bisa in-flight tanpa satu OS thread per request.
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 1, headers: dict | None = None,
+                 limit: int = 256, limit_per_host: int = 8, http2: bool = True):
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = dict(headers or {})
+        self.limit_per_host = limit_per_host
+        self._limits = httpx.Limits(max_connections=limit, max_keepalive_connections=limit,
+                                    keepalive_expiry=30)
+        self._http2 = http2
+        self._clients: dict[bool, httpx.AsyncClient] = {}   # verify ➜ client
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-http", daemon=True)
+        self._thread.start()
+
+    def _client(self, verify: bool) -> httpx.AsyncClient:
+        # verify di httpx diatur per client; client tanpa verifikasi hanya dibuat jika dipakai
+        if verify not in self._clients:
+            self._clients[verify] = httpx.AsyncClient(http2=self._http2, verify=verify,
+                                                      limits=self._limits, headers=self.headers,
+                                                      follow_redirects=True)
+        return self._clients[verify]
+
+    def _slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname or ""
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.limit_per_host)
+        return self._host_slots[host]
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def aget(self, url: str, params=None, headers=None, timeout: float = 10,
+                   verify: bool = True, max_bytes: int | None = None,
+                   body_markers: tuple[str, str] | None = None) -> AsyncResponse:
+        """GET dengan retry; body di-stream dengan batas byte yang sama seperti `fetch.CappedSession`."""
+        max_bytes = max_bytes or MAX_FETCH_BYTES
+        client = self._client(bool(verify))
+        attempt = 0
+        while True:
+            try:
+                async with self._slot(url), client.stream("GET", url, params=params, headers=headers,
+                                                          timeout=timeout) as resp:
+                    if resp.status_code in RETRY_STATUS and attempt < self.retries:
+                        raise httpx.HTTPStatusError(f"status {resp.status_code}",
+                                                    request=resp.request, response=resp)
+                    check_headers(str(resp.url), resp.headers, max_bytes)
+                    buf = BodyBuffer(str(resp.url), max_bytes, body_markers)
+                    async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                        if buf.feed(chunk):
+                            break
+                    return AsyncResponse(str(resp.url), resp.status_code, resp.headers, bytes(buf.data),
+                                         resp.charset_encoding)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if attempt >= self.retries:
+                    raise requests.ConnectionError(f"{url}: {e}") from e
+                await asyncio.sleep(self.backoff * (2 ** attempt))
+                attempt += 1
+
+    def get(self, url: str, **kwargs) -> AsyncResponse:
+        """Versi blocking dari `aget`, dipanggil dari thread scraper mana pun."""
+        return self._run(self.aget(url, **kwargs))
+
+    def get_many(self, urls, **kwargs) -> list:
+        """
+        GET semua `urls` bersamaan (asyncio.gather di event loop transport). Hasil berurutan
+        sesuai `urls`; request yang gagal dikembalikan sebagai exception, bukan di-raise.
+        """
+        async def gather():
+            return await asyncio.gather(*(self.aget(url, **kwargs) for url in urls),
+                                        return_exceptions=True)
+        return self._run(gather())
+
+    def close(self):
+        if self._loop.is_running():
+            for client in list(self._clients.values()):
+                self._run(client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
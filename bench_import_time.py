@@ -0,0 +1,64 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Modul yang dibandingkan: `app` (startup worker gunicorn) dan modul yang di-load lazily
+DEFAULT_MODULES = ["app", "scrapper", "summarizer", "classifier"]
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def cold_import(module: str) -> tuple[float, str]:
+    """Import `module` di interpreter baru; kembalikan (detik wall-clock, output -X importtime)."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    # `import app` membuka index SQLite dan melanjutkan checkpoint → arahkan ke folder sementara
+    with tempfile.TemporaryDirectory(prefix="bench_import_") as tmp:
+        env = dict(os.environ, SEARCH_INDEX_PATH=os.path.join(tmp, "index.sqlite3"),
+                   CHECKPOINT_DIR=os.path.join(tmp, "checkpoints"), WATCH_KEYWORDS="")
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                              capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import gagal")
+    return float(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+def top_imports(importtime_log: str, module: str, n: int):
+    """Import langsung dari `module` dengan waktu import kumulatif terbesar (µs)."""
+    # sub-import dicetak sebelum induknya: level 1 (indent 3) dikumpulkan sampai baris
+    # level 0 berikutnya, yang menentukan milik modul mana kumpulan itu
+    rows, children = [], []
+    for line in importtime_log.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        depth = len(m.group(3))
+        if depth == 3:
+            children.append((int(m.group(2)), m.group(4)))
+        elif depth <= 1:
+            if m.group(4) == module:
+                rows.extend(children)
+            children = []
+    return sorted(rows, reverse=True)[:n]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark waktu import (cold start)")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='Modul yang diukur')
+    parser.add_argument('--runs', type=int, default=5, help='Jumlah pengulangan per modul')
+    parser.add_argument('--top', type=int, default=8, help='Tampilkan N import termahal')
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            samples, log = [], ""
+            for _ in range(args.runs):
+                secs, log = cold_import(module)
+                samples.append(secs * 1000)
+        except RuntimeError as e:
+            print(f"{module:<12} ❌ {e}")
+            continue
+        print(f"{module:<12} median {statistics.median(samples):8.1f} ms   "
+              f"min {min(samples):8.1f} ms   ({args.runs} runs)")
+        for cumulative, name in top_imports(log, module, args.top):
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
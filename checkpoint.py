@@ -0,0 +1,109 @@
+import json
+import os
+import shutil
+import threading
+import time
+
+# Folder checkpoint job; satu subfolder per task_id
+CHECKPOINT_DIR = os.environ.get("CHECKPOINT_DIR", "checkpoints")
+# Job yang sudah sekian kali dilanjutkan setelah restart tanpa selesai tidak dicoba lagi
+MAX_RESUME_ATTEMPTS = int(os.environ.get("MAX_RESUME_ATTEMPTS", 3))
+
+
+def _write_atomic(path: str, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def article_key(art) -> str:
+    """Kunci stabil artikel antar-restart (link, atau judul jika link kosong)."""
+    return art.link or f"{art.site}:{art.title}"
+
+
+class JobCheckpoint:
+    """
+    Checkpoint satu job di disk:
+      job.json          parameter job (keyword, max_articles, since, until) + jumlah resume
+      sites/<nama>.json hasil scrape per site yang sudah selesai
+      enriched.jsonl    summary + kategori per artikel, ditambahkan satu baris per artikel
+    Job yang terputus dilanjutkan tanpa mengulang site atau panggilan LLM yang sudah selesai.
+    """
+
+    def __init__(self, task_id: str, root: str = CHECKPOINT_DIR):
+        self.task_id = task_id
+        self.dir = os.path.join(root, task_id)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, task_id: str, root: str = CHECKPOINT_DIR, **params) -> "JobCheckpoint":
+        ckpt = cls(task_id, root)
+        os.makedirs(os.path.join(ckpt.dir, "sites"), exist_ok=True)
+        _write_atomic(os.path.join(ckpt.dir, "job.json"),
+                      {"task_id": task_id, "created": time.time(), **params})
+        return ckpt
+
+    def params(self) -> dict:
+        with open(os.path.join(self.dir, "job.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def record_resume(self) -> int:
+        """Catat satu percobaan resume di job.json; mengembalikan jumlah resume sejauh ini."""
+        params = self.params()
+        params["resumes"] = params.get("resumes", 0) + 1
+        _write_atomic(os.path.join(self.dir, "job.json"), params)
+        return params["resumes"]
+
+    def site_results(self) -> dict[str, list[dict]]:
+        results = {}
+        sites_dir = os.path.join(self.dir, "sites")
+        for name in os.listdir(sites_dir) if os.path.isdir(sites_dir) else []:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(sites_dir, name), encoding="utf-8") as f:
+                    results[name[:-5]] = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Checkpoint site {name} rusak, di-scrape ulang: {e}")
+        return results
+
+    def save_site(self, name: str, rows: list[dict]):
+        _write_atomic(os.path.join(self.dir, "sites", f"{name}.json"), rows)
+
+    def enriched(self) -> dict[str, dict]:
+        done = {}
+        path = os.path.join(self.dir, "enriched.jsonl")
+        if not os.path.exists(path):
+            return done
+        line = "\n"
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:      # baris terakhir terpotong saat crash
+                    continue
+                done[rec["key"]] = rec
+        if not line.endswith("\n"):
+            # tutup baris terpotong agar append berikutnya mulai di baris baru
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n")
+        return done
+
+    def save_enriched(self, art):
+        line = json.dumps({"key": article_key(art), "summary": art.summary,
+                           "kategori": art.kategori}, ensure_ascii=False)
+        with self._lock, open(os.path.join(self.dir, "enriched.jsonl"), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def finish(self):
+        """Job selesai: checkpoint tidak diperlukan lagi."""
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def pending(root: str = CHECKPOINT_DIR) -> list[JobCheckpoint]:
+    """Checkpoint job yang belum selesai (mis. proses mati di tengah job)."""
+    if not os.path.isdir(root):
+        return []
+    return [JobCheckpoint(task_id, root) for task_id in sorted(os.listdir(root))
+            if os.path.exists(os.path.join(root, task_id, "job.json"))]
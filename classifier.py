@@ -1,7 +1,5 @@
-from groq import Groq
-
-# Inisialisasi client Groq
-client = Groq(api_key="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")
+import re
+from llm import get_client
 
 def get_prompt(text):
     return (
@@ -81,7 +79,7 @@ def get_prompt(text):
 def classify(summary_text):
     try:
         prompt = get_prompt(summary_text)
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="gemma-7b-it",
             messages=[{"role": "user", "content": prompt}]
         )
@@ -90,3 +88,21 @@ def classify(summary_text):
     except Exception as e:
         print(f"⚠️ Error saat klasifikasi: {e}")
         return "ERROR"
+
+# Baris daftar kategori dari prompt klasifikasi, mis. "C. 10. Industri Barang Galian bukan Logam"
+_CATEGORY_LINE_RE = re.compile(r"^([A-U](?:,[A-U])*)\.\s+(.+)$")
+
+def get_category_lines():
+    """Daftar kategori (semua level) persis seperti di get_prompt()."""
+    return [line for line in get_prompt("").splitlines() if _CATEGORY_LINE_RE.match(line)]
+
+def get_categories():
+    """Huruf sektor utama yang valid → nama sektor, diambil dari daftar di get_prompt()."""
+    categories = {}
+    for line in get_category_lines():
+        letters, name = _CATEGORY_LINE_RE.match(line).groups()
+        if name[0].isdigit():      # sub-kategori (A. 1. ...), bukan sektor utama
+            continue
+        for letter in letters.split(","):
+            categories.setdefault(letter, name)
+    return categories
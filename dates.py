@@ -0,0 +1,82 @@
+import datetime
+import re
+from functools import lru_cache
+
+# Satu tabel bulan gabungan Indonesia/Inggris (nama lengkap + singkatan), key lowercase
+MONTHS = {
+    "jan": 1, "januari": 1, "january": 1,
+    "feb": 2, "februari": 2, "february": 2, "pebruari": 2,
+    "mar": 3, "maret": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5, "mei": 5,
+    "jun": 6, "juni": 6, "june": 6,
+    "jul": 7, "juli": 7, "july": 7,
+    "aug": 8, "agu": 8, "agt": 8, "agus": 8, "agustus": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "okt": 10, "oktober": 10, "october": 10,
+    "nov": 11, "nop": 11, "november": 11, "nopember": 11,
+    "dec": 12, "des": 12, "desember": 12, "december": 12,
+}
+
+# Pola yang sudah dikompilasi, dicoba berurutan
+_ISO_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")                 # 2025-07-03T10:00:00
+_NUMERIC_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")             # 03/07/2025 - 10:00
+_NAMED_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)\.?,?\s+(\d{4})")    # Kamis, 3 Juli 2025 | ...
+
+
+def _make_date(y, m, d) -> datetime.date | None:
+    try:
+        return datetime.date(int(y), int(m), int(d))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def parse_date(raw: str) -> datetime.date | None:
+    """
+    Ubah string tanggal dari site mana pun (ISO, DD/MM/YYYY, "3 Juli 2025",
+    "Kamis, 03 Jul 2025 10:00 WIB", RFC 822, ...) menjadi `datetime.date`.
+    Hasil di-memo karena string mentah yang sama sering berulang.
+    """
+    if not raw:
+        return None
+    m = _ISO_RE.search(raw)
+    if m:
+        return _make_date(m.group(1), m.group(2), m.group(3))
+    m = _NUMERIC_RE.search(raw)
+    if m:
+        return _make_date(m.group(3), m.group(2), m.group(1))
+    for m in _NAMED_RE.finditer(raw):
+        month = MONTHS.get(m.group(2).lower())
+        if month:
+            return _make_date(m.group(3), month, m.group(1))
+    return None
+
+
+def format_date(d: datetime.date) -> str:
+    return d.strftime("%d/%m/%Y")
+
+
+def normalize_date(raw: str) -> str:
+    """Format tampilan 'DD/MM/YYYY'; string asli dikembalikan jika tidak bisa di-parse."""
+    d = parse_date(raw.strip()) if raw else None
+    return format_date(d) if d else (raw or "").strip()
+
+
+def to_date(value) -> datetime.date | None:
+    """Terima date/datetime/string (ISO atau DD/MM/YYYY) → `datetime.date`."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return parse_date(str(value).strip())
+
+
+def sort_by_date(rows, newest_first: bool = True, key=lambda r: r.date):
+    """Urutkan sekaligus; baris tanpa tanggal selalu di akhir."""
+    dated = [r for r in rows if key(r)]
+    undated = [r for r in rows if not key(r)]
+    dated.sort(key=key, reverse=newest_first)
+    return dated + undated
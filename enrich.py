@@ -0,0 +1,92 @@
+import json
+import os
+import re
+
+from llm import get_client, stream_completion
+from summarizer import summarize
+from classifier import classify, get_categories, get_category_lines
+
+# "combined": ringkasan + kategori dalam satu panggilan JSON; "separate": summarize() lalu classify()
+ENRICH_MODE = os.environ.get("ENRICH_MODE", "combined")
+ENRICH_MODEL = "llama3-8b-8192"
+
+CATEGORIES = get_categories()
+
+# Nilai "ringkasan" (mungkin belum lengkap) di output JSON yang sedang di-stream
+_PARTIAL_SUMMARY_RE = re.compile(r'"ringkasan"\s*:\s*"((?:[^"\\]|\\.)*)')
+# "kategori" harus kode sektor saja ("C", "C.", "C. 10."), bukan nama sektor atau kalimat
+_KATEGORI_RE = re.compile(r"\s*([A-U])\b[.\s\da-z]*")
+
+def get_enrich_prompt(text):
+    daftar = "\n".join(get_category_lines())
+    return (
+        "Baca teks berita berikut lalu kerjakan dua hal:\n"
+        "1. Ringkas menjadi 2–3 kalimat dalam Bahasa Indonesia yang jelas dan alami, "
+        "tanpa pembuka seperti “Ringkasan:” atau “Berikut ini adalah...”.\n"
+        "2. Tentukan kategori utama berdasarkan klasifikasi sektor ekonomi Indonesia berikut, "
+        "jawab dengan 1 huruf sektor saja (A–U):\n\n"
+        f"{daftar}\n\n"
+        "Balas HANYA dengan JSON satu objek, tanpa teks lain, dengan format:\n"
+        "{\"ringkasan\": \"...\", \"kategori\": \"C\"}\n\n"
+        f"Teks: \"{text.strip()}\""
+    )
+
+def partial_summary(raw: str) -> str:
+    """Ringkasan sejauh yang sudah diterima dari JSON yang belum lengkap."""
+    m = _PARTIAL_SUMMARY_RE.search(raw)
+    if not m:
+        return ""
+    value = m.group(1)
+    for cut in range(0, 7):            # escape yang terpotong di ujung (\, \u00..)
+        try:
+            return json.loads(f'"{value[:len(value) - cut]}"')
+        except ValueError:
+            continue
+    return ""
+
+def parse_enrichment(raw: str):
+    """(ringkasan, kategori) dari output JSON model, atau None jika tidak valid."""
+    if not isinstance(raw, str):
+        return None
+    start, end = raw.find("{"), raw.rfind("}")   # toleran terhadap ```json ... ``` di sekitarnya
+    try:
+        data = json.loads(raw[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    summary = data.get("ringkasan")
+    m = _KATEGORI_RE.fullmatch(str(data.get("kategori", "")))
+    if not isinstance(summary, str) or not summary.strip() or not m or m.group(1) not in CATEGORIES:
+        return None
+    return summary.strip(), m.group(1)
+
+def enrich(text, on_token=None):
+    """
+    Ringkasan + kategori KBLI untuk satu artikel. Mode gabungan memakai satu panggilan
+    Groq dengan output JSON; hanya jika output gagal di-parse/divalidasi, fallback ke
+    summarize() + classify(). Error API memberi hasil gagal yang sama seperti mode terpisah.
+    Dengan `on_token`, ringkasan parsial dikirim ke callback selama output di-stream.
+    """
+    if ENRICH_MODE == "combined":
+        request = dict(model=ENRICH_MODEL,
+                       messages=[{"role": "user", "content": get_enrich_prompt(text)}])
+        try:
+            if on_token:
+                # JSON mode tidak bisa di-stream; format JSON dijaga lewat prompt + validasi
+                raw = stream_completion(lambda partial: on_token(partial_summary(partial)), **request)
+            else:
+                response = get_client().chat.completions.create(
+                    response_format={"type": "json_object"}, **request)
+                raw = response.choices[0].message.content
+        except Exception as e:
+            # API gagal (limit, jaringan): 2 panggilan lagi hanya akan gagal juga
+            print(f"⚠️ Error saat enrichment gabungan: {e}")
+            return "Ringkasan gagal", "ERROR"
+        parsed = parse_enrichment(raw)
+        if parsed:
+            return parsed
+        print("⚠️ Output gabungan tidak valid, fallback ke 2 panggilan")
+
+    summary = summarize(text, on_token=on_token)
+    return summary, classify(summary)
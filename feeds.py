@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+# Cache feed per URL (ETag / Last-Modified + entri hasil parse), dipakai bersama oleh semua job
+FEED_CACHE_DIR = os.environ.get("FEED_CACHE_DIR", "feed_cache")
+# Dalam TTL feed dipakai langsung dari cache tanpa request; setelahnya GET kondisional (304)
+FEED_TTL = int(os.environ.get("FEED_TTL", 300))
+
+# Elemen entri: <item> RSS 2.0, <entry> Atom, <url> sitemap (termasuk news sitemap)
+_ENTRY_TAGS = {"item", "entry", "url"}
+_TITLE_TAGS = ("title",)                                      # news:title ikut (namespace dibuang)
+_DATE_TAGS = ("pubDate", "published", "publication_date", "date", "updated", "lastmod")
+_SUMMARY_TAGS = ("description", "summary", "content", "encoded")
+
+
+def _local(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _entry(elem) -> dict:
+    fields, link = {}, ""
+    for child in elem.iter():
+        name = _local(child.tag)
+        if name == "link" and not link:
+            # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+            if child.get("rel", "alternate") == "alternate":
+                link = (child.get("href") or child.text or "").strip()
+        elif name == "loc" and not link:
+            link = (child.text or "").strip()
+        elif child is not elem and name not in fields:
+            fields[name] = (child.text or "").strip()
+    pick = lambda tags: next((fields[t] for t in tags if fields.get(t)), "")
+    return {"title": pick(_TITLE_TAGS), "link": link,
+            "published": pick(_DATE_TAGS), "summary": pick(_SUMMARY_TAGS)}
+
+
+def parse_feed(body: bytes) -> list[dict]:
+    """Entri {title, link, published, summary} dari RSS, Atom atau (news) sitemap."""
+    root = ET.fromstring(body)
+    return [_entry(elem) for elem in root.iter() if _local(elem.tag) in _ENTRY_TAGS]
+
+
+class FeedCache:
+    """Satu file JSON per URL feed di `root`; entri di memori untuk job berikutnya."""
+
+    def __init__(self, root: str = FEED_CACHE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._mem: dict[str, dict] = {}
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+    def get(self, url: str) -> dict | None:
+        with self._lock:
+            if url in self._mem:
+                return self._mem[url]
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                rec = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._mem[url] = rec
+        return rec
+
+    def put(self, url: str, rec: dict):
+        with self._lock:
+            self._mem[url] = rec
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(url)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(rec, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+CACHE = FeedCache()
+
+
+def fetch_feed(session, url: str, cache: FeedCache = CACHE, ttl: int = FEED_TTL) -> list[dict]:
+    """
+    Entri feed `url` dengan GET kondisional (If-None-Match / If-Modified-Since).
+    304 atau cache yang masih dalam TTL tidak mengunduh ulang; jika fetch gagal,
+    entri lama di cache dipakai, dan jika belum ada cache error diteruskan.
+    """
+    rec = cache.get(url)
+    now = time.time()
+    if rec and now - rec["fetched"] < ttl:
+        return rec["entries"]
+
+    headers = {}
+    if rec and rec.get("etag"):
+        headers["If-None-Match"] = rec["etag"]
+    if rec and rec.get("last_modified"):
+        headers["If-Modified-Since"] = rec["last_modified"]
+    try:
+        resp = session.get(url, headers=headers, timeout=10)
+        if resp.status_code == 304 and rec:
+            cache.put(url, {**rec, "fetched": now})
+            return rec["entries"]
+        resp.raise_for_status()
+        entries = parse_feed(resp.content)
+    except Exception as e:
+        if not rec:
+            raise
+        print(f"[Feed] Gagal refresh {url}, pakai cache lama: {e}")
+        return rec["entries"]
+
+    cache.put(url, {"url": url, "fetched": now, "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"), "entries": entries})
+    return entries
@@ -0,0 +1,85 @@
+import os
+
+import requests
+
+# Batas byte body per request (setelah dekompresi); halaman lebih besar tidak diproses
+MAX_FETCH_BYTES = int(os.environ.get("MAX_FETCH_BYTES", 2 * 1024 * 1024))
+CHUNK_SIZE = 16 * 1024
+
+# Content-Type yang bisa diparse scraper (HTML, XML/RSS, JSON); selain itu (PDF, gambar, video) dilewati
+ALLOWED_TYPES = {"text/html", "application/xhtml+xml", "text/xml", "application/xml",
+                 "application/json", "text/plain"}
+
+
+class FetchSkipped(requests.RequestException):
+    """Response tidak dibaca: tipe konten tidak didukung atau body melebihi batas byte."""
+
+
+def check_headers(url: str, headers, max_bytes: int):
+    """Tolak response dari header saja, sebelum body dibaca."""
+    ctype = headers.get("Content-Type", "").split(";")[0].strip().lower()
+    if ctype and ctype not in ALLOWED_TYPES and not ctype.endswith(("+xml", "+json")):
+        raise FetchSkipped(f"Content-Type {ctype} dilewati: {url}")
+    length = headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise FetchSkipped(f"Content-Length {length} > {max_bytes} byte: {url}")
+
+
+class BodyBuffer:
+    """
+    Kumpulkan body per chunk dengan batas `max_bytes`. Dengan `markers=(awal, akhir)`,
+    pembacaan bisa berhenti begitu `akhir` muncul setelah `awal` (mis. container isi
+    artikel sudah tertutup), sisa halaman (komentar, sidebar, script) tidak diunduh.
+    """
+
+    def __init__(self, url: str, max_bytes: int, markers: tuple[str, str] | None = None):
+        self.url = url
+        self.max_bytes = max_bytes
+        self.data = bytearray()
+        self._start, self._end = (m.encode() for m in markers) if markers else (b"", b"")
+        self._body_at = -1 if self._start else 0
+        self._scanned = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Tambahkan chunk; True jika body yang dibutuhkan sudah lengkap."""
+        self.data += chunk
+        if len(self.data) > self.max_bytes:
+            raise FetchSkipped(f"Body > {self.max_bytes} byte: {self.url}")
+        if not self._end:
+            return False
+        if self._body_at < 0:
+            # penanda bisa terpotong di batas chunk → cari ulang dari sedikit sebelum chunk baru
+            i = self.data.find(self._start, max(0, self._scanned - len(self._start)))
+            self._scanned = len(self.data)
+            if i < 0:
+                return False
+            self._body_at = i + len(self._start)
+            self._scanned = self._body_at
+        j = self.data.find(self._end, max(self._body_at, self._scanned - len(self._end)))
+        self._scanned = len(self.data)
+        return j >= 0
+
+
+class CappedSession(requests.Session):
+    """
+    `requests.Session` yang `get()`-nya men-stream body: Content-Type dan Content-Length
+    dicek dari header, body dibaca per chunk sampai batas `max_bytes` atau sampai
+    `body_markers` terpenuhi. Hasilnya tetap `requests.Response` biasa (`.text`, `.json()`).
+    """
+
+    def get(self, url, max_bytes: int | None = None, body_markers: tuple[str, str] | None = None,
+            **kwargs):
+        max_bytes = max_bytes or MAX_FETCH_BYTES
+        resp = super().get(url, stream=True, **kwargs)
+        try:
+            check_headers(resp.url, resp.headers, max_bytes)
+            buf = BodyBuffer(resp.url, max_bytes, body_markers)
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                if buf.feed(chunk):
+                    break
+        finally:
+            # body tidak habis dibaca → koneksi ditutup, bukan dikembalikan ke pool
+            resp.close()
+        resp._content = bytes(buf.data)
+        resp._content_consumed = True
+        return resp
@@ -0,0 +1,38 @@
+import os
+import threading
+
+# API key Groq, wajib di-set lewat env GROQ_API_KEY (tidak ada default di kode)
+GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "")
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """
+    Client Groq bersama untuk summarizer & classifier, dibuat saat pertama kali dipakai
+    (import groq + setup HTTP client tidak dibayar saat startup).
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not GROQ_API_KEY:
+                    raise RuntimeError("GROQ_API_KEY belum di-set; isi env GROQ_API_KEY dengan API key Groq")
+                from groq import Groq
+                _client = Groq(api_key=GROQ_API_KEY)
+    return _client
+
+def stream_completion(on_token, **kwargs) -> str:
+    """
+    `chat.completions.create(stream=True, ...)`; `on_token(teks_sejauh_ini)` dipanggil
+    setiap ada potongan baru. Mengembalikan teks lengkap.
+    """
+    parts = []
+    for chunk in get_client().chat.completions.create(stream=True, **kwargs):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            on_token("".join(parts))
+    return "".join(parts)
@@ -0,0 +1,373 @@
+"""
+Load test end-to-end untuk app.py dengan banyak pengguna bersamaan.
+
+Server Flask asli dijalankan in-process; situs berita dan Groq diganti stand-in lokal
+dengan latensi yang bisa diatur, jadi tidak ada request keluar dan tidak ada biaya API:
+  - --scraper real (default): scraper asli di `scrapper` dijalankan terhadap server fixture
+    HTTP lokal (halaman pencarian + detail, latensi per request) untuk site di FIXTURE_SITES,
+    jadi fetch, parse, window tanggal dan checkpoint ikut diuji
+  - --scraper fake: modul `scrapper` diganti scraper palsu (latensi per site, artikel
+    sintetis); scraping sama sekali tidak diuji, hanya app + enrichment
+  - client Groq di `llm` diganti client palsu (latensi per panggilan)
+Setiap pengguna: POST / → GET /progress → poll /status tiap --poll detik → GET /download.
+
+    python loadtest.py --users 50 --poll 2 --articles 3
+"""
+import argparse
+import datetime
+import gzip
+import http.client
+import http.server
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from urllib.parse import parse_qs, urlencode, urlparse, urlsplit
+
+SITES = ["detik", "kompas", "beritasatu", "panturapost", "inews", "antara", "tvone",
+         "police", "suarajelata", "emsatunews", "arahpantura", "wp_rest", "rss"]
+
+# Site yang punya fixture HTML di FixtureHandler (mode --scraper real)
+FIXTURE_SITES = ["detik"]
+FIXTURE_PAGE_SIZE = 10     # artikel per halaman pencarian
+FIXTURE_PAGES = 5          # halaman pencarian yang berisi artikel; setelahnya kosong
+
+LOREM = ("Pemerintah provinsi mencatat kenaikan harga komoditas pangan di sejumlah pasar "
+         "tradisional, sementara pelaku usaha berharap distribusi kembali lancar. ")
+
+
+# ──────────────── Stand-in situs berita & Groq ────────────────
+def install_fake_scrapper(site_latency: float, jitter: float):
+    def scrape(keyword, max_articles=5, engine=None, since=None, until=None,
+               done_sites=None, on_site_done=None, profiler=None):
+        rows = []
+        for site in SITES:
+            time.sleep(site_latency * random.uniform(1 - jitter, 1 + jitter))
+            site_rows = [{"site": site, "tanggal": "03/07/2025",
+                          "title": f"{keyword} #{i} dari {site}",
+                          "content": LOREM * random.randint(5, 40),
+                          "link": f"https://{site}.example/{keyword}/{i}/{random.random()}"}
+                         for i in range(max_articles)]
+            if on_site_done:
+                on_site_done(site, site_rows)
+            rows.extend(site_rows)
+        return rows
+
+    module = types.ModuleType("scrapper")
+    module.scrape = scrape
+    sys.modules["scrapper"] = module
+
+
+class FixtureHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Meniru situs berita di FIXTURE_SITES. Path = host asli + path asli (lihat LocalSites),
+    mis. /www.detik.com/search/searchnews?query=..&page=2. Artikel di halaman `p` berumur
+    (p-1)*FIXTURE_PAGE_SIZE + i hari, jadi window tanggal menghentikan paginasi.
+    """
+    latency = 0.0
+    jitter = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency * random.uniform(1 - self.jitter, 1 + self.jitter))
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        if parts.path == "/www.detik.com/search/searchnews":
+            body = self._detik_search(query.get("query", [""])[0], int(query.get("page", ["1"])[0]))
+        elif parts.path.startswith("/www.detik.com/berita/"):
+            body = self._detik_detail()
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _detik_search(keyword: str, page: int) -> str:
+        items = []
+        if page <= FIXTURE_PAGES:
+            today = datetime.datetime.now().replace(hour=10, minute=0)
+            for i in range(FIXTURE_PAGE_SIZE):
+                n = (page - 1) * FIXTURE_PAGE_SIZE + i
+                tanggal = (today - datetime.timedelta(days=n)).strftime("%d/%m/%Y %H:%M")
+                items.append(
+                    f'<article class="list-content__item"><a href="https://www.detik.com/berita/d-{n}/{keyword}">'
+                    f'<h3 class="media__title">{keyword} #{n} dari detik</h3></a>'
+                    f'<span d-time="1" title="{tanggal} WIB"></span></article>')
+        return f"<html><body>{''.join(items)}</body></html>"
+
+    @staticmethod
+    def _detik_detail() -> str:
+        paras = "".join(f"<p>{LOREM}</p>" for _ in range(random.randint(5, 40)))
+        return (f'<html><body><article><div class="detail__body-text itp_bodycontent">{paras}</div>'
+                f'</article><div class="komentar">{LOREM * 50}</div></body></html>')
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalSites:
+    """Session scraper yang mengarahkan semua URL ke server fixture: https://host/path → base/host/path."""
+
+    def __init__(self, session, base: str):
+        self.session = session
+        self.base = base
+        if hasattr(session, "get_many"):     # engine async: fetch_details tetap lewat get_many
+            self.get_many = lambda urls, **kwargs: session.get_many(list(map(self._local, urls)), **kwargs)
+
+    def _local(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{self.base}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def get(self, url: str, **kwargs):
+        return self.session.get(self._local(url), **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def install_fixture_sites(latency: float, jitter: float) -> str:
+    """Jalankan server fixture dan arahkan scraper asli (hanya FIXTURE_SITES) ke sana."""
+    handler = type("Handler", (FixtureHandler,), {"latency": latency, "jitter": jitter})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = "http://%s:%d" % server.server_address[:2]
+
+    import scrapper
+    create_session = scrapper.create_session
+    scrapper.create_session = lambda *a, **k: LocalSites(create_session(*a, **k), base)
+    scrapper.SCRAPERS = [(name, func) for name, func in scrapper.SCRAPERS if name in FIXTURE_SITES]
+    return base
+
+
+class FakeGroq:
+    """Meniru `client.chat.completions.create(...)` dengan latensi tetap."""
+
+    def __init__(self, latency: float, jitter: float):
+        self.latency, self.jitter = latency, jitter
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency * random.uniform(1 - self.jitter, 1 + self.jitter))
+        if "Balas HANYA dengan JSON" in messages[-1]["content"]:   # prompt enrich gabungan
+            text = json.dumps({"ringkasan": LOREM.strip(), "kategori": "C"})
+        else:
+            text = "C" if "Kategori:" in messages[-1]["content"] else LOREM.strip()
+        if kwargs.get("stream"):
+            return self._stream(text)
+        message = types.SimpleNamespace(content=text)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    @staticmethod
+    def _stream(text: str, size: int = 8):
+        for i in range(0, len(text), size):
+            delta = types.SimpleNamespace(content=text[i:i + size])
+            yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)])
+
+
+# ──────────────── Pengukuran ────────────────
+class Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+        self.jobs: list[float] = []
+        # (t, thread job, thread request, TASKS bytes, RSS bytes)
+        self.samples: list[tuple[float, int, int, int, int]] = []
+
+    def record(self, route: str, secs: float, ok: bool):
+        with self._lock:
+            self.latency.setdefault(route, []).append(secs)
+            if not ok:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def tasks_bytes(tasks: dict) -> int:
+    """Perkiraan ukuran TASKS (dict task + record Article + string di dalamnya)."""
+    total = sys.getsizeof(tasks)
+    for task in list(tasks.values()):
+        total += sys.getsizeof(task)
+        rows = task.get("rows", [])
+        total += sys.getsizeof(rows)
+        for art in list(rows):
+            total += sys.getsizeof(art)
+            for name in art.__slots__:
+                total += sys.getsizeof(getattr(art, name, None))
+        for payload in task.get("payloads", {}).values():
+            total += len(payload.body) + sum(len(v) for v in payload._encoded.values())
+    return total
+
+
+def server_threads() -> tuple[int, int]:
+    """(thread worker job, thread request werkzeug) — thread pengguna virtual tidak dihitung."""
+    names = [t.name for t in threading.enumerate()]
+    return (sum(n.startswith("job-") for n in names),    # lihat app.launch_worker
+            sum("(process_request_thread)" in n for n in names))
+
+
+def monitor(stats: Stats, tasks: dict, stop: threading.Event, every: float):
+    start = time.perf_counter()
+    while not stop.wait(every):
+        stats.samples.append((time.perf_counter() - start, *server_threads(),
+                              tasks_bytes(tasks), rss_bytes()))
+
+
+# ──────────────── Pengguna virtual ────────────────
+def request(stats: Stats, route: str, host: str, port: int, method: str, path: str,
+            body: str | None = None):
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    headers = {"Accept-Encoding": "gzip"}
+    if body is not None:
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    ok = False
+    start = time.perf_counter()
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        data = resp.read()
+        ok = resp.status < 400
+        return resp, data
+    except (OSError, http.client.HTTPException):
+        return None, b""
+    finally:
+        stats.record(route, time.perf_counter() - start, ok)
+        conn.close()
+
+
+def user(stats: Stats, host: str, port: int, keyword: str, articles: int, poll: float, timeout: float,
+         since: str = ""):
+    started = time.perf_counter()
+    resp, _ = request(stats, "POST /", host, port, "POST", "/",
+                      urlencode({"keyword": keyword, "max_articles": articles, "since": since}))
+    if resp is None or resp.status not in (301, 302, 303):
+        return
+    task_id = urlparse(resp.getheader("Location")).path.rsplit("/", 1)[-1]
+    request(stats, "GET /progress", host, port, "GET", f"/progress/{task_id}")
+
+    while time.perf_counter() - started < timeout:
+        resp, data = request(stats, "GET /status", host, port, "GET", f"/status/{task_id}")
+        if resp is not None and resp.status == 200:
+            if resp.getheader("Content-Encoding") == "gzip":
+                data = gzip.decompress(data)
+            if json.loads(data).get("finished"):
+                with stats._lock:
+                    stats.jobs.append(time.perf_counter() - started)
+                break
+        time.sleep(poll)
+    else:
+        return
+    request(stats, "GET /download", host, port, "GET", f"/download/{task_id}")
+
+
+def report(stats: Stats, users: int, wall: float, llm_calls: int, scraper: str):
+    print(f"\n=== {users} pengguna, {wall:.1f} s, {llm_calls} panggilan LLM palsu ===")
+    if scraper == "real":
+        print(f"Scraper: asli terhadap fixture lokal ({', '.join(FIXTURE_SITES)}); site lain tidak diuji")
+    else:
+        print("Scraper: PALSU — fetch, parse, window tanggal dan checkpoint scrape tidak diuji")
+    print(f"{'route':<16}{'n':>7}{'err':>6}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for route, values in sorted(stats.latency.items()):
+        ms = [v * 1000 for v in values]
+        print(f"{route:<16}{len(ms):>7}{stats.errors.get(route, 0):>6}"
+              + "".join(f"{percentile(ms, p):>9.1f}" for p in (50, 90, 95, 99)) + f"{max(ms):>9.1f}")
+    if stats.jobs:
+        print(f"\nJob selesai: {len(stats.jobs)}/{users}   p50 {statistics.median(stats.jobs):.1f} s   "
+              f"p95 {percentile(stats.jobs, 95):.1f} s   max {max(stats.jobs):.1f} s")
+    else:
+        print(f"\nJob selesai: 0/{users}")
+    if stats.samples:
+        first, last = stats.samples[0], stats.samples[-1]
+        print(f"Thread: job puncak {max(s[1] for s in stats.samples)}, "
+              f"request puncak {max(s[2] for s in stats.samples)}")
+        print(f"TASKS : {first[3] / 1e6:.2f} MB → {last[3] / 1e6:.2f} MB "
+              f"(puncak {max(s[3] for s in stats.samples) / 1e6:.2f} MB)")
+        if last[4]:
+            print(f"RSS   : {first[4] / 1e6:.1f} MB → {last[4] / 1e6:.1f} MB "
+                  f"(puncak {max(s[4] for s in stats.samples) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test app.py dengan stand-in situs berita & Groq")
+    parser.add_argument('--users', type=int, default=50, help='Jumlah pengguna bersamaan')
+    parser.add_argument('--poll', type=float, default=2.0, help='Interval poll /status (detik)')
+    parser.add_argument('--articles', type=int, default=3, help='max_articles per site per job')
+    parser.add_argument('--ramp', type=float, default=5.0, help='Sebar kedatangan pengguna selama N detik')
+    parser.add_argument('--scraper', choices=['real', 'fake'], default='real',
+                        help='real: scraper asli + fixture HTTP lokal; fake: scraper palsu tanpa HTTP')
+    parser.add_argument('--engine', choices=['requests', 'async'], default='requests',
+                        help='Engine HTTP scraper asli (--scraper real)')
+    parser.add_argument('--since-days', type=int, default=20,
+                        help='Window tanggal job: artikel N hari terakhir (0 = tanpa window)')
+    parser.add_argument('--site-latency', type=float, default=0.2,
+                        help='Latensi per request HTTP fixture (real) atau per site (fake), detik')
+    parser.add_argument('--llm-latency', type=float, default=0.3, help='Latensi per panggilan LLM (detik)')
+    parser.add_argument('--jitter', type=float, default=0.3, help='Variasi latensi relatif (0..1)')
+    parser.add_argument('--timeout', type=float, default=600, help='Batas waktu per pengguna (detik)')
+    parser.add_argument('--sample', type=float, default=1.0, help='Interval sampling thread/memori (detik)')
+    args = parser.parse_args()
+
+    # state disk app (index, checkpoint) diarahkan ke folder sementara
+    workdir = tempfile.mkdtemp(prefix="berita_loadtest_")
+    os.environ.update(SEARCH_INDEX_PATH=os.path.join(workdir, "index.sqlite3"),
+                      CHECKPOINT_DIR=os.path.join(workdir, "checkpoints"),
+                      WATCH_KEYWORDS="", SCRAPER_ENGINE=args.engine)
+    if args.scraper == "real":
+        print(f"Fixture situs di {install_fixture_sites(args.site_latency, args.jitter)}")
+    else:
+        install_fake_scrapper(args.site_latency, args.jitter)
+    import llm
+    fake = FakeGroq(args.llm_latency, args.jitter)
+    llm._client = fake
+    import app as webapp
+    from werkzeug.serving import make_server
+
+    server = make_server("127.0.0.1", 0, webapp.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    print(f"Server uji di http://{host}:{port} (data di {workdir})")
+
+    stats, stop = Stats(), threading.Event()
+    threading.Thread(target=monitor, args=(stats, webapp.TASKS, stop, args.sample), daemon=True).start()
+
+    since = ((datetime.date.today() - datetime.timedelta(days=args.since_days)).isoformat()
+             if args.since_days else "")
+    start = time.perf_counter()
+    users = []
+    for i in range(args.users):
+        t = threading.Thread(target=user, daemon=True,
+                             args=(stats, host, port, f"uji{i}", args.articles, args.poll, args.timeout, since))
+        t.start()
+        users.append(t)
+        time.sleep(args.ramp / max(args.users, 1))
+    for t in users:
+        t.join()
+    stop.set()
+    server.shutdown()
+    report(stats, args.users, time.perf_counter() - start, fake.calls, args.scraper)
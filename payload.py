@@ -0,0 +1,49 @@
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:   # brotli opsional; tanpa itu hanya gzip yang ditawarkan
+    brotli = None
+
+# Body lebih kecil dari ini tidak dikompresi (overhead header > penghematan)
+MIN_COMPRESS_BYTES = 512
+# Urutan preferensi server
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+class Payload:
+    """
+    Body respons yang sudah diserialisasi, dengan ETag kuat dan cache versi terkompresi.
+    Untuk task yang sudah selesai objek ini disimpan sekali lalu dipakai ulang setiap hit.
+    """
+
+    __slots__ = ("body", "etag", "_encoded")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        self._encoded: dict[str, bytes] = {}
+
+    def encoded(self, encoding: str | None) -> bytes:
+        if not encoding:
+            return self.body
+        data = self._encoded.get(encoding)
+        if data is None:
+            if encoding == "br":
+                data = brotli.compress(self.body, quality=5)
+            else:
+                data = gzip.compress(self.body, compresslevel=6)
+            self._encoded[encoding] = data
+        return data
+
+    def etag_for(self, encoding: str | None) -> str:
+        """ETag kuat per representasi (body gzip ≠ body br ≠ body asli)."""
+        return f"{self.etag}-{encoding}" if encoding else self.etag
+
+
+def negotiate(accept_encodings, size: int) -> str | None:
+    """Pilih encoding dari header Accept-Encoding (objek Accept werkzeug)."""
+    if size < MIN_COMPRESS_BYTES:
+        return None
+    return accept_encodings.best_match(ENCODINGS)
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+
+# Watchlist kata kunci yang di-crawl otomatis, mis. WATCH_KEYWORDS="inflasi,harga beras,ekspor"
+WATCHLIST = [k.strip() for k in os.environ.get("WATCH_KEYWORDS", "").split(",") if k.strip()]
+PRECRAWL_INTERVAL = int(os.environ.get("PRECRAWL_INTERVAL", 3600))        # detik antar putaran
+PRECRAWL_MAX_ARTICLES = int(os.environ.get("PRECRAWL_MAX_ARTICLES", 20))  # per site
+IDLE_POLL = 5                                                             # detik, cek ulang saat sibuk
+# Hasil hangat lama baru dibuang setelah sekian detik tidak diakses (pengguna yang sudah
+# diarahkan ke task itu masih bisa poll /status dan /download)
+WARM_GRACE = int(os.environ.get("PRECRAWL_GRACE", 900))
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def lower_thread_priority(niceness: int = 19):
+    """Turunkan prioritas thread ini saja (Linux: nice per thread); diabaikan jika tidak didukung."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), niceness)
+    except (AttributeError, OSError):
+        pass
+
+
+class Precrawler:
+    """
+    Crawl + ringkas + klasifikasi watchlist secara berkala di satu thread berprioritas rendah,
+    hanya saat tidak ada job pengguna yang berjalan. Hasil terakhir tiap kata kunci
+    disimpan sebagai task "hangat" yang bisa langsung dipakai oleh request pengguna.
+
+    `run_job(keyword, max_articles)` menjalankan job sampai selesai dan mengembalikan task_id;
+    `is_busy()` bernilai True selama ada job pengguna yang masih berjalan;
+    `discard_job(task_id)` (opsional) membuang hasil hangat lama yang sudah digantikan;
+    mengembalikan False jika task itu masih dipakai, lalu dicoba lagi pada putaran berikutnya.
+    """
+
+    def __init__(self, keywords, run_job, is_busy, discard_job=None,
+                 interval: int = PRECRAWL_INTERVAL, max_articles: int = PRECRAWL_MAX_ARTICLES):
+        self.keywords = list(keywords)
+        self.run_job = run_job
+        self.is_busy = is_busy
+        self.discard_job = discard_job
+        self.interval = interval
+        self.max_articles = max_articles
+        self.warm: dict[str, tuple[str, float]] = {}   # keyword ➜ (task_id, selesai pada)
+        self.retired: list[str] = []                   # hasil hangat lama yang belum dibuang
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread or not self.keywords:
+            return
+        self._thread = threading.Thread(target=self._loop, name="precrawl", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def lookup(self, keyword: str, max_articles: int) -> str | None:
+        """task_id hasil hangat untuk `keyword`, jika masih segar dan cukup banyak artikelnya."""
+        entry = self.warm.get(normalize_keyword(keyword))
+        if not entry or max_articles > self.max_articles:
+            return None
+        task_id, finished_at = entry
+        if time.time() - finished_at > 2 * self.interval:
+            return None
+        return task_id
+
+    def _wait_idle(self) -> bool:
+        while self.is_busy():
+            if self._stop.wait(IDLE_POLL):
+                return False
+        return not self._stop.is_set()
+
+    def _sweep(self):
+        if self.discard_job:
+            self.retired = [task_id for task_id in self.retired if self.discard_job(task_id) is False]
+
+    def _loop(self):
+        lower_thread_priority()
+        while not self._stop.is_set():
+            for keyword in self.keywords:
+                if not self._wait_idle():
+                    return
+                print(f"[Precrawl] Mulai: {keyword}")
+                try:
+                    task_id = self.run_job(keyword, self.max_articles)
+                except Exception as e:
+                    print(f"[Precrawl] Gagal {keyword}: {e}")
+                    continue
+                old = self.warm.get(normalize_keyword(keyword))
+                self.warm[normalize_keyword(keyword)] = (task_id, time.time())
+                if old:
+                    self.retired.append(old[0])
+                self._sweep()
+                print(f"[Precrawl] ✅ {keyword} → task {task_id}")
+            self._sweep()
+            self._stop.wait(self.interval)
@@ -0,0 +1,141 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Folder hasil profiling; satu subfolder per task_id
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+# File di tiap subfolder (nama ➜ mimetype), bisa diunduh lewat /profile/<task_id>
+PROFILE_FILES = {
+    "report.txt": "text/plain",         # ringkasan: span per site, artikel terlambat, fungsi teratas
+    "trace.json": "application/json",   # timeline span (Chrome trace / Perfetto / speedscope)
+    "cpu.pstats": "application/octet-stream",   # cProfile gabungan semua thread job (pstats/snakeviz)
+}
+REPORT_TOP = 30
+
+
+class JobProfiler:
+    """
+    Profil satu job: cProfile per thread yang ikut mengerjakan job (worker, scrape,
+    thread per site) + timeline wall-clock span (job, site, artikel, panggilan LLM).
+    Span direkam sebagai trace event "X" sehingga timeline bisa dibuka di Perfetto.
+    """
+
+    def __init__(self, task_id: str, root: str = PROFILE_DIR):
+        self.task_id = task_id
+        self.dir = os.path.join(root, task_id)
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: list[dict] = []
+        self._threads: dict[int, str] = {}
+        self._profiles: list[cProfile.Profile] = []
+
+    @contextmanager
+    def span(self, name: str, cat: str = "job", profile: bool = False, **args):
+        """
+        Catat durasi blok sebagai span. Dengan `profile=True` thread ini juga di-cProfile
+        selama blok berjalan (sekali per thread; span bersarang tidak memulai profil baru).
+        """
+        prof = self._start_profile() if profile else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if prof:
+                prof.disable()
+                self._local.active = False
+            thread = threading.current_thread()
+            event = {"name": name, "cat": cat, "ph": "X", "pid": 1, "tid": thread.ident,
+                     "ts": round((start - self._t0) * 1e6), "dur": round((end - start) * 1e6),
+                     "args": args}
+            with self._lock:
+                self._events.append(event)
+                self._threads[thread.ident] = thread.name
+                if prof:
+                    self._profiles.append(prof)
+
+    def _start_profile(self) -> cProfile.Profile | None:
+        if getattr(self._local, "active", False):
+            return None
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError:   # profiler lain sudah aktif di thread ini
+            return None
+        self._local.active = True
+        return prof
+
+    def trace(self) -> dict:
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        meta = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+                for tid, name in threads.items()]
+        return {"traceEvents": meta + sorted(events, key=lambda e: e["ts"]),
+                "displayTimeUnit": "ms", "otherData": {"task_id": self.task_id}}
+
+    def stats(self) -> pstats.Stats | None:
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = None
+        for prof in profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(prof)
+                else:
+                    stats.add(prof)
+            except TypeError:    # profil kosong
+                continue
+        return stats
+
+    def report(self) -> str:
+        with self._lock:
+            events = list(self._events)
+        out = io.StringIO()
+        out.write(f"Profil task {self.task_id}\n")
+        for title, cat, key, limit in (("Span per site", "site", "site", None),
+                                       ("Artikel paling lambat", "article", "title", 10)):
+            spans = sorted((e for e in events if e["cat"] == cat), key=lambda e: -e["dur"])
+            if not spans:
+                continue
+            out.write(f"\n== {title} ==\n")
+            for e in spans[:limit]:
+                out.write(f"{e['dur'] / 1e6:9.2f} s  {e['args'].get(key, e['name'])}\n")
+        for e in events:
+            if e["cat"] == "job":
+                out.write(f"\n{e['name']}: {e['dur'] / 1e6:.2f} s\n")
+
+        stats = self.stats()
+        if stats:
+            out.write(f"\n== cProfile (cumulative, {REPORT_TOP} teratas) ==\n")
+            stats.stream = out
+            stats.sort_stats("cumulative").print_stats(REPORT_TOP)
+        return out.getvalue()
+
+    def save(self) -> str:
+        """Tulis report.txt, trace.json dan cpu.pstats ke PROFILE_DIR/<task_id>."""
+        os.makedirs(self.dir, exist_ok=True)
+        with open(os.path.join(self.dir, "trace.json"), "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f, ensure_ascii=False)
+        stats = self.stats()
+        if stats:
+            stats.dump_stats(os.path.join(self.dir, "cpu.pstats"))
+        with open(os.path.join(self.dir, "report.txt"), "w", encoding="utf-8") as f:
+            f.write(self.report())
+        return self.dir
+
+
+class _NullProfiler:
+    """Pengganti JobProfiler saat profiling tidak aktif: span tanpa biaya."""
+
+    def span(self, name: str, cat: str = "job", profile: bool = False, **args):
+        return nullcontext()
+
+
+NULL_PROFILER = _NullProfiler()
@@ -1,15 +1,20 @@
 import csv
+import os
 import time
 import datetime
 import re
 import requests
 import html
-import feedparser
 import warnings
 from bs4 import BeautifulSoup
 import argparse
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dates import normalize_date, parse_date, sort_by_date, to_date
+from fetch import CappedSession
+from profiling import NULL_PROFILER, JobProfiler
+from feeds import fetch_feed
 
 # Global headers for all requests
 HEADERS = {
@@ -20,31 +25,133 @@ HEADERS = {
     )
 }
 
+# Engine HTTP default: "requests" (blocking) atau "async" (httpx + HTTP/2, lihat async_http.py)
+SCRAPER_ENGINE = os.environ.get("SCRAPER_ENGINE", "requests")
+# Discovery listing default: "search" (halaman pencarian HTML) atau "feed" (RSS/Atom/sitemap, lihat FEEDS)
+SCRAPER_DISCOVERY = os.environ.get("SCRAPER_DISCOVERY", "search")
+
 # Retry session factory
-def create_session(retries: int = 3, backoff: float = 1):
-    sess = requests.Session()
+def create_session(retries: int = 3, backoff: float = 1, engine: str | None = None):
+    engine = engine or SCRAPER_ENGINE
+    if engine == "async":
+        from async_http import AsyncSession
+        return AsyncSession(retries=retries, backoff=backoff, headers=HEADERS)
+    if engine != "requests":
+        raise ValueError(f"Engine tidak dikenal: {engine}")
+    sess = CappedSession()   # body di-stream dengan batas byte, lihat fetch.py
     retry = Retry(total=retries, backoff_factor=backoff,
                   status_forcelist=[429,500,502,503,504], allowed_methods=["GET"])
-    adapter = HTTPAdapter(max_retries=retry)
+    # pool cukup besar untuk fetch paralel (mis. WP-REST) tanpa membuang koneksi keep-alive
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=32)
     sess.mount("https://", adapter)
     sess.mount("http://", adapter)
     sess.headers.update(HEADERS)
     return sess
 
-# DETIK.COM scraper
-MONTH_MAP_DETIK = {"Jan":1,"Feb":2,"Mar":3,"Apr":4,"Mei":5,"Jun":6,
-                   "Jul":7,"Agt":8,"Sep":9,"Okt":10,"Nov":11,"Des":12}
+# Penanda (awal, akhir) container isi artikel di halaman detail: pembacaan body berhenti
+# di `</article>` pertama setelah container, sisa halaman (komentar, sidebar, script) dilewati
+BODY_MARKERS = {
+    "detik": ('class="detail__body-text', "</article>"),
+    "kompas": ('class="read__content', "</article>"),
+    "tvone": ('class="detail-content', "</article>"),
+    "beritasatu": ('b1-article body-content', "</article>"),
+    "panturapost": ('class="read__content', "</article>"),
+    "inews": ('class="bodyArticleWrapper', "</article>"),
+    "police": ('class="entry-content', "</article>"),
+    "suarajelata": ('class="entry-content', "</article>"),
+    "emsatunews": ('class="entry-content', "</article>"),
+    "arahpantura": ('class="entry-inner', "</article>"),
+}
 
-def parse_detik_date(raw: str) -> str:
-    try:
-        part = raw.split(",",1)[1].strip()
-        seg = part.split()
-        return f"{int(seg[0]):02d}/{MONTH_MAP_DETIK.get(seg[1],0):02d}/{int(seg[2])}"
-    except:
-        return raw
+def fetch_details(session, urls: list[str], delay: float = 0, **kwargs) -> list:
+    """
+    GET halaman detail dari satu halaman listing. Engine async: semua URL dikirim bersamaan
+    (AsyncSession.get_many → asyncio.gather); requests: berurutan dengan jeda `delay` detik.
+    Hasil berurutan sesuai `urls`: response yang lolos raise_for_status(), atau exception.
+    """
+    if hasattr(session, "get_many"):
+        responses = session.get_many(urls, **kwargs)
+    else:
+        responses = []
+        for i, url in enumerate(urls):
+            if i and delay:
+                time.sleep(delay)
+            try:
+                responses.append(session.get(url, **kwargs))
+            except Exception as e:
+                responses.append(e)
+    results = []
+    for resp in responses:
+        if not isinstance(resp, Exception):
+            try:
+                resp.raise_for_status()
+            except Exception as e:
+                resp = e
+        results.append(resp)
+    return results
+
+# Berhenti paginasi setelah sekian halaman berturut-turut tanpa artikel di dalam window
+MAX_WINDOW_EMPTY_PAGES = 3
+
+class DateWindow:
+    """
+    Filter tanggal since/until untuk satu scraper, dicek dari tanggal di halaman listing
+    sebelum GET detail. Untuk listing yang terurut terbaru-dulu (`newest_first`),
+    artikel pertama yang lebih tua dari `since` menandai paginasi selesai, dan halaman
+    yang seluruhnya lebih baru dari `until` tidak dihitung kosong (window belum tercapai).
+    """
+
+    def __init__(self, since=None, until=None, newest_first: bool = False):
+        self.since = to_date(since)
+        self.until = to_date(until)
+        self.newest_first = newest_first
+        self.exhausted = False
+        self._hits = 0
+        self._newer = 0
+        self._empty_pages = 0
+
+    def __bool__(self):
+        return bool(self.since or self.until)
 
-def scrape_detik(keyword: str, max_articles: int, session: requests.Session):
+    def accept(self, tanggal: str) -> bool:
+        if not self:
+            return True
+        d = parse_date(tanggal)
+        if d is None:          # tanggal tidak terbaca → jangan dibuang
+            self._hits += 1
+            return True
+        if self.until and d > self.until:
+            self._newer += 1
+            return False
+        if self.since and d < self.since:
+            if self.newest_first:
+                self.exhausted = True
+            return False
+        self._hits += 1
+        return True
+
+    def page_done(self) -> bool:
+        """Panggil di akhir tiap halaman listing; True jika paginasi sebaiknya berhenti."""
+        if self:
+            if self._hits or (self.newest_first and self._newer):
+                self._empty_pages = 0
+            else:
+                self._empty_pages += 1
+            self._hits = self._newer = 0
+            if self._empty_pages >= MAX_WINDOW_EMPTY_PAGES:
+                self.exhausted = True
+        return self.exhausted
+
+# Parser isi artikel per site (dari soup halaman detail), dipakai scraper HTML dan discovery feed
+def _content_detik(ds) -> str:
+    paras = ds.find_all("div", class_="detail__body-text itp_bodycontent")
+    return " ".join(p.get_text(strip=True) for block in paras for p in block.find_all("p"))
+
+# DETIK.COM scraper
+def scrape_detik(keyword: str, max_articles: int, session: requests.Session,
+                 since=None, until=None, skip=None):
     results = []
+    window = DateWindow(since, until, newest_first=True)   # sortby=time
     count, page = 0, 1
     while count < max_articles:
         url = f"https://www.detik.com/search/searchnews?query={keyword}&sortby=time&page={page}"
@@ -53,61 +160,41 @@ def scrape_detik(keyword: str, max_articles: int, session: requests.Session):
         soup = BeautifulSoup(resp.text, "lxml")
         items = soup.find_all("article", class_="list-content__item")
         if not items: break
+        found = []
         for art in items:
-            if count >= max_articles: break
+            if count + len(found) >= max_articles: break
             a = art.find("a", href=True)
             link = a['href']; title = art.find("h3", class_="media__title").get_text(strip=True)
-            # detail
+            raw = art.find("span", attrs={"d-time": True})
+            tanggal = normalize_date(raw['title']) if raw and raw.has_attr('title') else ""
+            if not window.accept(tanggal):
+                if window.exhausted: break
+                continue
+            if skip and link in skip: continue   # sudah didapat dari feed
+            found.append((tanggal, title, link))
+        # detail (engine async: semua detail halaman ini bersamaan)
+        details = fetch_details(session, [f[2] for f in found], timeout=10, body_markers=BODY_MARKERS["detik"])
+        for (tanggal, title, link), d in zip(found, details):
             try:
-                d = session.get(link, timeout=10); d.raise_for_status()
-                ds = BeautifulSoup(d.text, "lxml")
-                paras = ds.find_all("div", class_="detail__body-text itp_bodycontent")
-                content = " ".join(p.get_text(strip=True)
-                                       for block in paras for p in block.find_all("p"))
+                if isinstance(d, Exception): raise d
+                content = _content_detik(BeautifulSoup(d.text, "lxml"))
             except:
                 content = ""
-            raw = art.find("span", attrs={"d-time": True})
-            tanggal = parse_detik_date(raw['title']) if raw and raw.has_attr('title') else ""
             results.append({'site':'detik','tanggal':tanggal,'title':title,'content':content,'link':link})
             count += 1; print(f"   ✅ [Detik {count}] {title[:50]}…")
+        if window.page_done(): break
         page += 1
     return results
 
 # KOMPAS.COM scraper
-MONTH_MAP = {
-    "Jan": 1, "Januari": 1,
-    "Feb": 2, "Februari": 2,
-    "Mar": 3, "Maret": 3,
-    "Apr": 4, "April": 4,
-    "May": 5, "Mei": 5,
-    "Jun": 6, "Juni": 6,
-    "Jul": 7, "Juli": 7,
-    "Aug": 8, "Agu": 8, "Agt": 8, "Agustus": 8,
-    "Sep": 9, "Sept": 9, "September": 9,
-    "Oct": 10, "Okt": 10, "Oktober": 10,
-    "Nov": 11, "November": 11,
-    "Dec": 12, "Des": 12, "Desember": 12
-}
-
-def parse_kompas_date(raw: str) -> str:
-    parts = raw.strip().split()
-    if len(parts) >= 3:
-        try:
-            d = int(parts[0])
-            m = MONTH_MAP.get(parts[1], 0)
-            y = int(parts[2])
-            if m:
-                return f"{d:02d}/{m:02d}/{y}"
-        except:
-            pass
-    return raw
-
-def scrape_kompas(keyword: str, max_articles: int, session: requests.Session):
+def scrape_kompas(keyword: str, max_articles: int, session: requests.Session,
+                  since=None, until=None):
     """
     Scrape Kompas.com search untuk `keyword` hingga `max_articles`.
     Mengembalikan list dict: [{'site','tanggal','title','content','link'}, ...]
     """
     results = []
+    window = DateWindow(since, until)
     scraped = 0
     page = 1
     while scraped < max_articles:
@@ -127,8 +214,9 @@ def scrape_kompas(keyword: str, max_articles: int, session: requests.Session):
             print("[Kompas] Tidak ada artikel lagi.")
             break
 
+        found = []
         for art in items:
-            if scraped >= max_articles:
+            if scraped + len(found) >= max_articles:
                 break
 
             a = art.find("a", class_="article-link", href=True)
@@ -140,12 +228,20 @@ def scrape_kompas(keyword: str, max_articles: int, session: requests.Session):
 
             date_tag = art.find("div", class_="articlePost-date")
             raw = date_tag.get_text(strip=True) if date_tag else ""
-            tanggal = parse_kompas_date(raw)
+            tanggal = normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
+            found.append((tanggal, title, link))
 
+        details = fetch_details(session, [f[2] for f in found], delay=1, headers=HEADERS, timeout=10,
+                                body_markers=BODY_MARKERS["kompas"])
+        for (tanggal, title, link), d in zip(found, details):
             content = ""
             try:
-                d = session.get(link, headers=HEADERS, timeout=10)
-                d.raise_for_status()
+                if isinstance(d, Exception):
+                    raise d
                 ds = BeautifulSoup(d.text, "lxml")
                 cont = ds.find("div", class_="read__content")
                 if cont:
@@ -164,14 +260,17 @@ def scrape_kompas(keyword: str, max_articles: int, session: requests.Session):
             results.append({'site':'kompas','tanggal':tanggal,'title':title,'content':content,'link':link})
             scraped += 1
             print(f"   ✅ [Kompas {scraped}] {title[:50]}…")
-            time.sleep(1)
 
+        if window.page_done():
+            break
         page += 1
     return results
 
 # BERITASATU.COM scraper
-def scrape_beritasatu(keyword: str, max_articles: int, session: requests.Session):
+def scrape_beritasatu(keyword: str, max_articles: int, session: requests.Session,
+                      since=None, until=None):
     results=[]; scraped, page = 0,1
+    window=DateWindow(since, until)
     while scraped<max_articles:
         url=f"https://www.beritasatu.com/search/{keyword}/{page}"
         print(f"[BeritaSatu] GET {url}")
@@ -179,42 +278,37 @@ def scrape_beritasatu(keyword: str, max_articles: int, session: requests.Session
         soup=BeautifulSoup(resp.text,"html.parser")
         rows=soup.select("div.row.mt-4.position-relative")
         if not rows: break
+        found=[]
         for row in rows:
-            if scraped>=max_articles: break
+            if scraped+len(found)>=max_articles: break
             a=row.find("a",class_="stretched-link",href=True)
             link=a['href'];
             if link.startswith("/"): link="https://www.beritasatu.com"+link
             judul=row.find("h2",class_="h5 fw-bold").get_text(strip=True)
             raw=row.select_one("span.b1-date.text-muted small").get_text(strip=True).split("|")[0].strip()
-            try: dt=datetime.datetime.strptime(raw,"%d %b %Y"); tanggal=dt.strftime("%d/%m/%Y")
-            except: tanggal=raw
-            art=session.get(link,timeout=10); art.raise_for_status(); asp=BeautifulSoup(art.text,"html.parser")
+            tanggal=normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted: break
+                continue
+            found.append((tanggal,judul,link))
+        for (tanggal,judul,link),art in zip(found,fetch_details(session,[f[2] for f in found],delay=1,timeout=10,
+                                                              body_markers=BODY_MARKERS["beritasatu"])):
+            if isinstance(art,Exception):
+                print(f"[BeritaSatu] Gagal ambil detail {link}: {art}"); continue
+            asp=BeautifulSoup(art.text,"html.parser")
             paras=asp.select_one("div.col.b1-article.body-content") or asp.select_one("article.main")
-            content=" ".join(p.get_text(strip=True) for p in paras.find_all("p"))
+            content=" ".join(p.get_text(strip=True) for p in paras.find_all("p")) if paras else ""
             results.append({'site':'beritasatu','tanggal':tanggal,'title':judul,'content':content,'link':link})
-            scraped+=1; print(f"   ✅ [BeritaSatu {scraped}] {judul[:50]}…"); time.sleep(1)
+            scraped+=1; print(f"   ✅ [BeritaSatu {scraped}] {judul[:50]}…")
+        if window.page_done(): break
         page+=1
     return results
     
 # PANTURAPOST.COM scraper (revisi)
-MONTH_MAP_PANTURA = {
-    "Januari": "01", "Februari": "02", "Maret": "03", "April": "04",
-    "Mei": "05",    "Juni":    "06", "Juli":  "07",   "Agustus":  "08",
-    "September": "09","Oktober": "10","November":"11","Desember":"12"
-}
-
-def parse_pantura_date(raw: str) -> str:
-    try:
-        part = raw.split(",", 1)[1].strip()
-        date_str = part.split("|", 1)[0].strip()   # e.g. "3 Juli 2025"
-        day, month_name, year = date_str.split()
-        month = MONTH_MAP_PANTURA.get(month_name, "00")
-        return f"{int(day):02d}/{month}/{year}"
-    except:
-        return raw
-
-def scrape_panturapost(keyword: str, max_articles: int, session: requests.Session):
+def scrape_panturapost(keyword: str, max_articles: int, session: requests.Session,
+                       since=None, until=None):
     results = []
+    window = DateWindow(since, until, newest_first=True)   # sort=latest
     count = 0
     page = 1
 
@@ -231,8 +325,9 @@ def scrape_panturapost(keyword: str, max_articles: int, session: requests.Sessio
         if not items:
             break
 
+        found = []
         for item in items:
-            if count >= max_articles:
+            if count + len(found) >= max_articles:
                 break
 
             right = item.find("div", class_="latest__right")
@@ -244,13 +339,21 @@ def scrape_panturapost(keyword: str, max_articles: int, session: requests.Sessio
 
             date_tag = right.find("date", class_="latest__date") if right else None
             raw_date = date_tag.get_text(strip=True) if date_tag else ""
-            tanggal = parse_pantura_date(raw_date)
+            tanggal = normalize_date(raw_date)
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
+            found.append((tanggal, title, link))
 
+        details = fetch_details(session, [f[2] for f in found], timeout=10,
+                                body_markers=BODY_MARKERS["panturapost"])
+        for (tanggal, title, link), art_res in zip(found, details):
             # fetch only <article class="read__content clearfix">
             content = ""
             try:
-                art_res = session.get(link, timeout=10)
-                art_res.raise_for_status()
+                if isinstance(art_res, Exception):
+                    raise art_res
                 art_soup = BeautifulSoup(art_res.text, "lxml")
                 article = art_soup.find("article", class_="read__content clearfix")
                 paras = article.find_all("p") if article else []
@@ -271,6 +374,8 @@ def scrape_panturapost(keyword: str, max_articles: int, session: requests.Sessio
             count += 1
             print(f"   ✅ [PanturaPost {count}] {title[:40]}…")
 
+        if window.page_done():
+            break
         page += 1
         time.sleep(1)
 
@@ -278,60 +383,59 @@ def scrape_panturapost(keyword: str, max_articles: int, session: requests.Sessio
 
 
 # INEWS.ID scraper
-MONTH_MAP_INEWS={**MONTH_MAP_PANTURA}
-def parse_inews_date(raw:str)->str:
-    try:
-        part=raw.split(",",1)[1].split("-",1)[0].strip(); d,mon,y=part.split();
-        return f"{int(d):02d}/{MONTH_MAP_INEWS.get(mon,'00')}/{y}"
-    except: return raw
-
-def scrape_inews(keyword:str, max_articles:int, session: requests.Session):
+def scrape_inews(keyword:str, max_articles:int, session: requests.Session, since=None, until=None):
     results=[]; scraped,page=0,1
+    window=DateWindow(since, until)  # tanggal hanya ada di halaman detail
     while scraped<max_articles:
         url=f"https://www.inews.id/find?q={keyword}&page={page}"
         print(f"[iNews] GET {url}")
         r=session.get(url,timeout=10); r.raise_for_status(); soup=BeautifulSoup(r.text,"lxml")
         cards=soup.find_all("article",class_="cardArticle")
         if not cards: break
-        for card in cards:
-            if scraped>=max_articles: break
+        found=[]
+        for card in cards[:max_articles-scraped]:
             a=card.select_one(".cardBody a[href]"); link=a['href'] if a['href'].startswith("http") else "https://www.inews.id"+a['href']
-            title=card.select_one("h3.cardTitle").get_text(strip=True)
-            det=session.get(link,timeout=10); det.raise_for_status(); ds=BeautifulSoup(det.text,"lxml")
+            found.append((card.select_one("h3.cardTitle").get_text(strip=True), link))
+        for (title,link),det in zip(found,fetch_details(session,[f[1] for f in found],delay=1,timeout=10)):
+            if isinstance(det,Exception):
+                print(f"[iNews] Gagal ambil detail {link}: {det}"); continue
+            ds=BeautifulSoup(det.text,"lxml")
             raw=ds.select_one(".timeAndShare .createdAt").get_text(strip=True) if ds.select_one(".timeAndShare .createdAt") else ""
-            tanggal=parse_inews_date(raw)
+            tanggal=normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted: break
+                continue
             body=ds.select_one("section.mainBody article.bodyArticleWrapper")
             content_parts=[]
             if body:
                 for p in body.find_all("p", recursive=False):
                     txt=p.get_text(strip=True)
                     if txt and not txt.startswith("Editor:"): content_parts.append(txt)
-            for a2 in ds.select("ul.paginationContent a[href]"):
-                href=a2['href']; sub=session.get(href,timeout=10); sub_soup=BeautifulSoup(sub.text,"lxml")
+            sub_urls=[a2['href'] for a2 in ds.select("ul.paginationContent a[href]")]
+            for sub in fetch_details(session,sub_urls,timeout=10,body_markers=BODY_MARKERS["inews"]):
+                if isinstance(sub,Exception): continue
+                sub_soup=BeautifulSoup(sub.text,"lxml")
                 sub_body=sub_soup.select_one("section.mainBody article.bodyArticleWrapper")
                 if sub_body:
                     content_parts.extend(p.get_text(strip=True) for p in sub_body.find_all("p", recursive=False)
                                           if not p.get_text(strip=True).startswith("Editor:"))
             content=" ".join(content_parts)
             results.append({'site':'inews','tanggal':tanggal,'title':title,'content':content,'link':link})
-            scraped+=1; print(f"   ✅ [iNews {scraped}] {title[:50]}…"); time.sleep(1)
+            scraped+=1; print(f"   ✅ [iNews {scraped}] {title[:50]}…")
+        if window.page_done(): break
         page+=1
     return results
 
-# ANTARANEWS scraper
-MONTH_MAP_EN={"January":"01","February":"02","March":"03","April":"04",
-             "May":"05","June":"06","July":"07","August":"08",
-             "September":"09","October":"10","November":"11","December":"12"}
-
-def parse_antara_date(raw:str)->str:
-    try:
-        part=raw.split("/",1)[1] if "/" in raw else raw
-        tokens=part.strip().split()
-        return f"{int(tokens[0]):02d}/{MONTH_MAP_EN.get(tokens[1],'00')}/{tokens[2]}"
-    except: return raw
+def _content_antara(ds) -> str:
+    cont=ds.select_one("div.post-content.clearfix.font17[itemprop=articleBody]")
+    paras=cont.find_all("p") if cont else []
+    return " ".join(p.get_text(" ",strip=True) for p in paras if p.get_text(strip=True))
 
-def scrape_antaranews(keyword:str, max_articles:int, session: requests.Session):
+# ANTARANEWS scraper
+def scrape_antaranews(keyword:str, max_articles:int, session: requests.Session, since=None, until=None,
+                      skip=None):
     results=[]; scraped,page=0,1
+    window=DateWindow(since, until)
     while scraped<max_articles:
         url=(f"https://jateng.antaranews.com/search?q={keyword}&startDate=&endDate=&submit=Submit"
              if page==1 else f"https://jateng.antaranews.com/search/{keyword}/{page}")
@@ -339,31 +443,39 @@ def scrape_antaranews(keyword:str, max_articles:int, session: requests.Session):
         r=session.get(url,timeout=10); r.raise_for_status(); soup=BeautifulSoup(r.text,"lxml")
         items=soup.select("article.simple-post.simple-big.clearfix")
         if not items: break
+        found=[]
         for art in items:
-            if scraped>=max_articles: break
+            if scraped+len(found)>=max_articles: break
             a=art.select_one("header h3 a[href]"); title=a.get_text(strip=True); link=a['href']
             if link.startswith("/"): link="https://jateng.antaranews.com"+link
             share=art.select_one("header p.simple-share"); raw=share.get_text(" ",strip=True) if share else ""
-            tanggal=parse_antara_date(raw)
+            tanggal=normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted: break
+                continue
+            if skip and link in skip: continue   # sudah didapat dari feed
+            found.append((tanggal,title,link))
+        for (tanggal,title,link),det in zip(found,fetch_details(session,[f[2] for f in found],timeout=10)):
             try:
-                det=session.get(link,timeout=10); ds=BeautifulSoup(det.text,"lxml")
-                cont=ds.select_one("div.post-content.clearfix.font17[itemprop=articleBody]")
-                paras=cont.find_all("p") if cont else []
-                content=" ".join(p.get_text(" ",strip=True) for p in paras if p.get_text(strip=True))
+                if isinstance(det,Exception): raise det
+                content=_content_antara(BeautifulSoup(det.text,"lxml"))
             except:
                 content=""
             results.append({'site':'antara','tanggal':tanggal,'title':title,'content':content,'link':link})
             scraped+=1; print(f"   ✅ [Antara {scraped}] {title[:60]}…")
+        if window.page_done(): break
         page+=1; time.sleep(1)
     return results
 
 # TVONENEWS scraper
-def scrape_tvonenews(keyword: str, max_articles: int, session: requests.Session):
+def scrape_tvonenews(keyword: str, max_articles: int, session: requests.Session,
+                     since=None, until=None):
     """
     Scrape TVOneNews.com untuk `keyword` hingga `max_articles`.
     Mengembalikan list dict: [{'site','tanggal','title','content','link'},...]
     """
     results=[]; scraped,page=0,1
+    window=DateWindow(since, until)
     while scraped<max_articles:
         url=f"https://www.tvonenews.com/cari?q={keyword}&page={page}"
         print(f"[TVOne] GET {url}")
@@ -372,23 +484,26 @@ def scrape_tvonenews(keyword: str, max_articles: int, session: requests.Session)
         container=listing.find("div",id="load-content") or listing.find("div",class_="article-list-container")
         rows=container.find_all("div",class_="article-list-row") if container else []
         if not rows: break
+        found=[]
         for row in rows:
-            if scraped>=max_articles: break
+            if scraped+len(found)>=max_articles: break
             a=row.select_one("div.article-list-info a.ali-title")
             if not a: continue
             title=a.get_text(strip=True); link=a['href']
             if link.startswith("/"): link="https://www.tvonenews.com"+link
             date_tag=row.select_one("div.article-list-info ul.ali-misc li.ali-date span")
             raw=date_tag.get_text(strip=True) if date_tag else ""
-            part=raw.split("-",1)[0].strip()
-            try:
-                d,m,y=part.split("/"); tanggal=f"{int(d):02d}/{int(m):02d}/{int(y)}"
-            except:
-                tanggal=part
-            detail_url=link+("&page=all" if "?" in link else "?page=all")
+            tanggal=normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted: break
+                continue
+            found.append((tanggal,title,link))
+        detail_urls=[link+("&page=all" if "?" in link else "?page=all") for _,_,link in found]
+        for (tanggal,title,link),dresp in zip(found,fetch_details(session,detail_urls,timeout=10,
+                                                                     body_markers=BODY_MARKERS["tvone"])):
             content=""
             try:
-                dresp=session.get(detail_url,timeout=10); dresp.raise_for_status()
+                if isinstance(dresp,Exception): raise dresp
                 dsoup=BeautifulSoup(dresp.text,"lxml")
                 detail=dsoup.find("div",class_="detail-content")
                 paras=detail.find_all("p") if detail else []
@@ -399,36 +514,32 @@ def scrape_tvonenews(keyword: str, max_articles: int, session: requests.Session)
                 print(f"[TVOne] detail failed: {e}")
             results.append({'site':'tvone','tanggal':tanggal,'title':title,'content':content,'link':link})
             scraped+=1; print(f"   ✅ [Antara {scraped}] {title[:60]}…")
+        if window.page_done(): break
         page+=1; time.sleep(1)
     return results
 
-# Scrape IndonesianPoliceNews (new)
-MONTH_MAP_POLICE = {
-    "Januari": 1, "Februari": 2, "Maret": 3, "April": 4,
-    "Mei": 5,     "Juni":    6, "Juli": 7,    "Agustus": 8,
-    "September": 9, "Oktober": 10, "November": 11, "Desember": 12
-}
-
-def parse_date_indo(raw: str) -> str:
-    parts = raw.strip().split()
-    if len(parts) >= 3:
-        try:
-            day = int(parts[0])
-            mon = MONTH_MAP_POLICE.get(parts[1], 0)
-            year = int(parts[2])
-            if 1 <= mon <= 12:
-                return f"{day:02d}/{mon:02d}/{year}"
-        except:
-            pass
-    return raw
-
+def _content_police(dsoup) -> str:
+    cont = dsoup.find("div", class_="entry-content")
+    paras = cont.find_all("p") if cont else []
+    texts = []
+    for p in paras:
+        txt = p.get_text(" ", strip=True)
+        if not txt or txt.lower().startswith("read more"):
+            continue
+        if "advertisement" in txt.lower():
+            continue
+        texts.append(txt)
+    return " ".join(texts)
 
-def scrape_police(keyword: str, max_articles: int, session: requests.Session):
+# Scrape IndonesianPoliceNews (new)
+def scrape_police(keyword: str, max_articles: int, session: requests.Session,
+                  since=None, until=None, skip=None):
     """
     Scrape IndonesianPoliceNews.id for `keyword` up to `max_articles`.
     Returns list of dicts with keys: site, tanggal, title, content, link.
     """
     results = []
+    window = DateWindow(since, until)
     scraped = 0
     page = 1
     while scraped < max_articles:
@@ -445,8 +556,9 @@ def scrape_police(keyword: str, max_articles: int, session: requests.Session):
         if not cards:
             print("[Police] No more articles.")
             break
+        found = []
         for card in cards:
-            if scraped >= max_articles:
+            if scraped + len(found) >= max_articles:
                 break
             a = card.select_one("h2.entry-title a")
             if not a:
@@ -455,37 +567,53 @@ def scrape_police(keyword: str, max_articles: int, session: requests.Session):
             link = a["href"]
             date_tag = card.select_one("span.entry-date")
             raw = date_tag.get_text(strip=True) if date_tag else ""
-            tanggal = parse_date_indo(raw)
+            tanggal = normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
+            if skip and link in skip:   # sudah didapat dari feed
+                continue
+            found.append((tanggal, title, link))
+        details = fetch_details(session, [f[2] for f in found], timeout=10,
+                                body_markers=BODY_MARKERS["police"])
+        for (tanggal, title, link), det in zip(found, details):
             content = ""
             try:
-                det = session.get(link, timeout=10)
-                det.raise_for_status()
-                dsoup = BeautifulSoup(det.text, "lxml")
-                cont = dsoup.find("div", class_="entry-content")
-                paras = cont.find_all("p") if cont else []
-                texts = []
-                for p in paras:
-                    txt = p.get_text(" ", strip=True)
-                    if not txt or txt.lower().startswith("read more"):
-                        continue
-                    if "advertisement" in txt.lower():
-                        continue
-                    texts.append(txt)
-                content = " ".join(texts)
+                if isinstance(det, Exception):
+                    raise det
+                content = _content_police(BeautifulSoup(det.text, "lxml"))
             except Exception as e:
                 print(f"[Police] detail failed: {e}")
             results.append({'site':'police','tanggal':tanggal,'title':title,'content':content,'link':link})
             scraped+=1; print(f"   ✅ [PoliceNews {scraped}] {title[:60]}…")
+        if window.page_done():
+            break
         page+=1; time.sleep(1)
     return results
 
+def _content_suarajelata(dsoup) -> str:
+    cont = dsoup.find(
+        "div", class_="entry-content entry-content-single clearfix"
+    )
+    paras = cont.find_all("p") if cont else []
+    texts = []
+    for p in paras:
+        txt = p.get_text(" ", strip=True)
+        if not txt or txt.lower().startswith("scroll untuk lanjut"):
+            continue
+        texts.append(txt)
+    return " ".join(texts)
+
 # SuaraJelata scraper
-def scrape_suarajelata(keyword: str, max_articles: int, session: requests.Session):
+def scrape_suarajelata(keyword: str, max_articles: int, session: requests.Session,
+                       since=None, until=None, skip=None):
     """
     Scrape SuaraJelata.com for `keyword` up to `max_articles`.
     Returns list of dicts: {site, tanggal, title, content, link}
     """
     results = []
+    window = DateWindow(since, until)
     scraped = 0
     paged = 1
     while scraped < max_articles:
@@ -504,8 +632,9 @@ def scrape_suarajelata(keyword: str, max_articles: int, session: requests.Sessio
             print("[SuaraJelata] Tidak ada artikel lagi, berhenti.")
             break
 
+        found = []
         for card in cards:
-            if scraped >= max_articles:
+            if scraped + len(found) >= max_articles:
                 break
             a = card.select_one("h2.entry-title a[href]")
             if not a:
@@ -515,28 +644,25 @@ def scrape_suarajelata(keyword: str, max_articles: int, session: requests.Sessio
             # parse tanggal
             time_tag = card.select_one("time.entry-date.published")
             if time_tag and time_tag.has_attr("datetime"):
-                iso = time_tag["datetime"].split("T")[0]
-                y, m, d = iso.split("-")
-                tanggal = f"{d}/{m}/{y}"
+                tanggal = normalize_date(time_tag["datetime"])
             else:
-                tanggal = time_tag.get_text(strip=True) if time_tag else ""
-            # fetch detail
+                tanggal = normalize_date(time_tag.get_text(strip=True)) if time_tag else ""
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
+            if skip and link in skip:   # sudah didapat dari feed
+                continue
+            found.append((tanggal, title, link))
+        # fetch detail
+        details = fetch_details(session, [f[2] for f in found], timeout=10,
+                                body_markers=BODY_MARKERS["suarajelata"])
+        for (tanggal, title, link), det in zip(found, details):
             content = ""
             try:
-                det = session.get(link, timeout=10)
-                det.raise_for_status()
-                dsoup = BeautifulSoup(det.text, "lxml")
-                cont = dsoup.find(
-                    "div", class_="entry-content entry-content-single clearfix"
-                )
-                paras = cont.find_all("p") if cont else []
-                texts = []
-                for p in paras:
-                    txt = p.get_text(" ", strip=True)
-                    if not txt or txt.lower().startswith("scroll untuk lanjut"):
-                        continue
-                    texts.append(txt)
-                content = " ".join(texts)
+                if isinstance(det, Exception):
+                    raise det
+                content = _content_suarajelata(BeautifulSoup(det.text, "lxml"))
             except Exception as e:
                 print(f"[SuaraJelata] Gagal ambil detail {link}: {e}")
 
@@ -548,30 +674,35 @@ def scrape_suarajelata(keyword: str, max_articles: int, session: requests.Sessio
                 'link': link
             })
             scraped += 1; print(f"   ✅ [SuaraJelata {scraped}] {title[:40]}…")
+        if window.page_done():
+            break
         paged += 1; time.sleep(1)
     return results
 
-# EmsatuNews scraper
-MONTH_MAP_EMSATU = {
-    "Januari": "01", "Februari": "02", "Maret": "03", "April": "04",
-    "Mei": "05",    "Juni":     "06", "Juli":  "07",   "Agustus": "08",
-    "September":"09","Oktober": "10","November":"11","Desember":"12"
-}
-
-def parse_date_emsatu(raw: str) -> str:
-    parts = raw.split()
-    for i in range(len(parts)-2):
-        day, mon, year = parts[i], parts[i+1], parts[i+2]
-        if day.isdigit() and mon in MONTH_MAP_EMSATU:
-            return f"{int(day):02d}/{MONTH_MAP_EMSATU[mon]}/{year}"
-    return raw.strip()
+def _content_emsatunews(dsoup) -> str:
+    cont = dsoup.find(
+        "div", class_="entry-content entry-content-single clearfix have-stickybanner"
+    )
+    paras = cont.find_all("p") if cont else []
+    parts = []
+    for p in paras:
+        txt = p.get_text(" ", strip=True)
+        if not txt:
+            continue
+        if p.find("div", class_="gmr-banner") or txt.lower().startswith("scroll untuk lanjut"):
+            continue
+        parts.append(txt)
+    return " ".join(parts)
 
-def scrape_emsatunews(keyword: str, max_articles: int, session: requests.Session):
+# EmsatuNews scraper
+def scrape_emsatunews(keyword: str, max_articles: int, session: requests.Session,
+                      since=None, until=None, skip=None):
     """
     Scrape EmsatuNews.co.id up to `max_articles` for `keyword`.
     Returns list of dicts: {site, tanggal, title, content, link}
     """
     results = []
+    window = DateWindow(since, until)
     scraped = 0
     page = 1
     while scraped < max_articles:
@@ -588,8 +719,9 @@ def scrape_emsatunews(keyword: str, max_articles: int, session: requests.Session
         if not cards:
             print("[EmsatuNews] Tidak ada artikel lagi, berhenti.")
             break
+        found = []
         for card in cards:
-            if scraped >= max_articles:
+            if scraped + len(found) >= max_articles:
                 break
             a = card.select_one("div.box-content h2.entry-title a[href]")
             if not a:
@@ -599,31 +731,26 @@ def scrape_emsatunews(keyword: str, max_articles: int, session: requests.Session
             # parse tanggal
             time_tag = card.select_one("time.entry-date.published")
             if time_tag and time_tag.has_attr("datetime"):
-                iso = time_tag["datetime"].split("T")[0]
-                y, m, d = iso.split("-")
-                tanggal = f"{d}/{m}/{y}"
+                tanggal = normalize_date(time_tag["datetime"])
             else:
                 raw = time_tag.get_text(" ", strip=True) if time_tag else ""
-                tanggal = parse_date_emsatu(raw)
-            # fetch detail
+                tanggal = normalize_date(raw)
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
+            if skip and link in skip:   # sudah didapat dari feed
+                continue
+            found.append((tanggal, title, link))
+        # fetch detail
+        details = fetch_details(session, [f[2] for f in found], timeout=10,
+                                body_markers=BODY_MARKERS["emsatunews"])
+        for (tanggal, title, link), det in zip(found, details):
             content = ""
             try:
-                det = session.get(link, timeout=10)
-                det.raise_for_status()
-                dsoup = BeautifulSoup(det.text, "lxml")
-                cont = dsoup.find(
-                    "div", class_="entry-content entry-content-single clearfix have-stickybanner"
-                )
-                paras = cont.find_all("p") if cont else []
-                parts = []
-                for p in paras:
-                    txt = p.get_text(" ", strip=True)
-                    if not txt:
-                        continue
-                    if p.find("div", class_="gmr-banner") or txt.lower().startswith("scroll untuk lanjut"):
-                        continue
-                    parts.append(txt)
-                content = " ".join(parts)
+                if isinstance(det, Exception):
+                    raise det
+                content = _content_emsatunews(BeautifulSoup(det.text, "lxml"))
             except Exception as e:
                 print(f"[EmsatuNews] Gagal ambil detail {link}: {e}")
 
@@ -635,17 +762,32 @@ def scrape_emsatunews(keyword: str, max_articles: int, session: requests.Session
                 'link': link
             })
             scraped += 1;print(f"   ✅ [EmsatuNews {scraped}] {title[:50]}…")
+        if window.page_done():
+            break
         page += 1;time.sleep(1)
     return results
 
+def _content_arahpantura(dsoup) -> str:
+    entry = dsoup.select_one("div.entry-inner")
+    if not entry:
+        return ""
+    paras = entry.find_all("p")
+    texts = [p.get_text(" ", strip=True)
+             for p in paras
+             if p.get_text(strip=True)
+             and not p.select_one("div.crp_related, div.wp-caption")]
+    return " ".join(texts)
+
 # ArahPantura scraper
-def scrape_arahpantura(keyword: str, max_articles: int, session: requests.Session):
+def scrape_arahpantura(keyword: str, max_articles: int, session: requests.Session,
+                       since=None, until=None, skip=None):
     """
     Scrape ArahPantura.id for `keyword` up to `max_articles`.
     Returns list of dicts: {site, tanggal, title, content, link}
     Uses CSS selector for article IDs instead of regex.
     """
     results = []
+    window = DateWindow(since, until)   # tanggal hanya ada di halaman detail
     scraped = 0
     page = 1
     while scraped < max_articles:
@@ -662,38 +804,35 @@ def scrape_arahpantura(keyword: str, max_articles: int, session: requests.Sessio
         if not cards:
             print("[ArahPantura] No more articles, stopping.")
             break
+        found = []
         for card in cards:
-            if scraped >= max_articles:
+            if scraped + len(found) >= max_articles:
                 break
             link_tag = card.select_one("h2.post-title.entry-title a[href]")
             if not link_tag:
                 continue
-            title = link_tag.get_text(strip=True)
-            link = link_tag['href'].strip()
-            # fetch detail page
-            det = session.get(link, timeout=10)
-            det.raise_for_status()
+            if skip and link_tag['href'].strip() in skip:   # sudah didapat dari feed
+                continue
+            found.append((link_tag.get_text(strip=True), link_tag['href'].strip()))
+        # fetch detail page
+        details = fetch_details(session, [f[1] for f in found], timeout=10,
+                                body_markers=BODY_MARKERS["arahpantura"])
+        for (title, link), det in zip(found, details):
+            if isinstance(det, Exception):
+                print(f"[ArahPantura] Gagal ambil detail {link}: {det}")
+                continue
             dsoup = BeautifulSoup(det.text, "lxml")
             # parse tanggal
             tanggal = ""
             time_tag = dsoup.select_one("time.published[datetime]")
             if time_tag:
-                iso = time_tag['datetime'].split('T')[0]
-                try:
-                    dt_obj = datetime.fromisoformat(iso)
-                    tanggal = dt_obj.strftime("%d/%m/%Y")
-                except:
-                    tanggal = iso
+                tanggal = normalize_date(time_tag['datetime'])
+            if not window.accept(tanggal):
+                if window.exhausted:
+                    break
+                continue
             # extract content
-            entry = dsoup.select_one("div.entry-inner")
-            content = ""
-            if entry:
-                paras = entry.find_all("p")
-                texts = [p.get_text(" ", strip=True)
-                         for p in paras
-                         if p.get_text(strip=True)
-                         and not p.select_one("div.crp_related, div.wp-caption")]
-                content = " ".join(texts)
+            content = _content_arahpantura(dsoup)
             results.append({
                 'site': 'arahpantura',
                 'tanggal': tanggal,
@@ -702,6 +841,8 @@ def scrape_arahpantura(keyword: str, max_articles: int, session: requests.Sessio
                 'link': link
             })
             scraped += 1;print(f"   ✅ [ArahPantura {scraped}] {title[:60]}…")
+        if window.page_done():
+            break
         page += 1;time.sleep(1)
     return results
 
@@ -718,56 +859,209 @@ DOMAINS = [
     "editorindonesia.com"
 ]
 
-def parse_iso_date(iso: str) -> str:
+WP_REST_FIELDS = "date,modified,title,link,content"
+WP_REST_MAX_PER_PAGE = 100   # batas per_page dari WP-REST
+WP_REST_WORKERS = 8
+# satu halaman JSON (per_page=100, isi lengkap) bisa jauh di atas batas halaman HTML
+WP_REST_MAX_BYTES = 16 * 1024 * 1024
+
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]+>", re.S | re.I)
+_SPACE_RE = re.compile(r"\s+")
+
+def strip_html(raw: str) -> str:
     """
-    Ubah ISO date 'YYYY-MM-DDTHH:MM:SS' → 'DD/MM/YYYY'
+    Ubah HTML → teks biasa tanpa membangun DOM (jauh lebih cepat dari BeautifulSoup
+    untuk `content.rendered` WP-REST yang strukturnya sederhana).
     """
+    if not raw:
+        return ""
+    text = _TAG_RE.sub(" ", raw)
+    return _SPACE_RE.sub(" ", html.unescape(text)).strip()
+
+def _wp_rest_iso(value) -> str:
+    """Terima datetime/date/string, kembalikan ISO 8601 untuk parameter after/modified_after."""
+    if isinstance(value, datetime.datetime):
+        return value.replace(microsecond=0).isoformat()
+    if isinstance(value, datetime.date):
+        return f"{value.isoformat()}T00:00:00"
+    return str(value)
+
+def _wp_rest_page(session: requests.Session, api_url: str, params: dict, page: int):
+    resp = session.get(api_url, params={**params, "page": page}, timeout=10,
+                       max_bytes=WP_REST_MAX_BYTES)
+    resp.raise_for_status()
+    return resp
+
+def _scrape_wp_rest_domain(domain: str, keyword: str, max_posts: int,
+                           session: requests.Session, after=None, modified_after=None, before=None):
+    api_url = f"https://{domain}/wp-json/wp/v2/posts"
+    per_page = max(1, min(max_posts, WP_REST_MAX_PER_PAGE))
+    params = {"search": keyword, "per_page": per_page, "_fields": WP_REST_FIELDS,
+              "orderby": "date", "order": "desc"}
+    if after:
+        params["after"] = _wp_rest_iso(after)
+    if modified_after:
+        params["modified_after"] = _wp_rest_iso(modified_after)
+    if before:
+        params["before"] = _wp_rest_iso(before)
+
+    first = _wp_rest_page(session, api_url, params, 1)
+    posts = first.json()
     try:
-        dt = datetime.fromisoformat(iso)
-        return dt.strftime("%d/%m/%Y")
-    except Exception:
-        return iso.split("T")[0] if "T" in iso else iso
+        total_pages = int(first.headers.get("X-WP-TotalPages", 1))
+    except ValueError:
+        total_pages = 1
+    # halaman yang masih dibutuhkan untuk memenuhi max_posts, diambil paralel
+    needed = min(total_pages, -(-max_posts // per_page))
+    if needed > 1 and len(posts) < max_posts:
+        with ThreadPoolExecutor(max_workers=min(WP_REST_WORKERS, needed - 1)) as pool:
+            futures = [pool.submit(_wp_rest_page, session, api_url, params, page)
+                       for page in range(2, needed + 1)]
+            for fut in futures:   # urutan halaman tetap dijaga
+                try:
+                    posts.extend(fut.result().json())
+                except Exception as e:
+                    print(f"[WP-REST] Gagal fetch halaman lanjutan {domain}: {e}")
+                    break
 
+    results = []
+    for post in posts[:max_posts]:
+        results.append({
+            'site': domain,
+            'tanggal': normalize_date(post.get("date", "")),
+            'title': html.unescape(post.get("title", {}).get("rendered", "")),
+            'content': strip_html(post.get("content", {}).get("rendered", "")),
+            'link': post.get("link", "")
+        })
+    return results
 
-def scrape_wp_rest(keyword: str, max_posts_per_domain: int, session: requests.Session):
+def scrape_wp_rest(keyword: str, max_posts_per_domain: int, session: requests.Session,
+                   since=None, until=None, after=None, modified_after=None):
     """
-    Query WP-REST API untuk setiap domain di DOMAINS
+    Query WP-REST API untuk semua domain di DOMAINS secara paralel.
+    Hanya field yang dipakai yang diminta (`_fields`), `per_page` disesuaikan dengan
+    `max_posts_per_domain`, dan halaman berikutnya diambil paralel berdasar `X-WP-TotalPages`.
+    `after` / `modified_after` (datetime atau ISO string) untuk query inkremental;
+    window `since`/`until` diteruskan ke server sebagai `after`/`before`.
     Returns list of dicts: {site, tanggal, title, content, link}
     """
+    since, until = to_date(since), to_date(until)
+    after = after or since
+    before = until + datetime.timedelta(days=1) if until else None
+    per_domain = {}
+    with ThreadPoolExecutor(max_workers=len(DOMAINS)) as pool:
+        futures = {pool.submit(_scrape_wp_rest_domain, domain, keyword, max_posts_per_domain,
+                               session, after, modified_after, before): domain
+                   for domain in DOMAINS}
+        for fut in as_completed(futures):
+            domain = futures[fut]
+            try:
+                per_domain[domain] = fut.result()
+            except Exception as e:
+                print(f"[WP-REST] Gagal fetch {domain}: {e}")
+                continue
+            print(f"[WP-REST] Selesai domain: ✅ [{domain}] ({len(per_domain[domain])} posts)")
+
+    # hasil tetap berurutan sesuai DOMAINS
     results = []
     for domain in DOMAINS:
-        api_url = f"https://{domain}/wp-json/wp/v2/posts?search={keyword}"
+        results.extend(per_domain.get(domain, []))
+    return results
+
+# Feed/sitemap per site untuk discovery="feed"; site tanpa entri tetap lewat pencarian HTML
+FEEDS = {
+    "detik":       ["https://rss.detik.com/index.php/detikcom", "https://rss.detik.com/index.php/finance"],
+    "antara":      ["https://jateng.antaranews.com/rss/terkini.xml"],
+    "police":      ["https://indonesianpolicenews.id/feed/"],
+    "suarajelata": ["https://suarajelata.com/feed/"],
+    "emsatunews":  ["https://emsatunews.co.id/feed/"],
+    "arahpantura": ["https://arahpantura.id/feed/"],
+}
+CONTENT_PARSERS = {
+    "detik":       _content_detik,
+    "antara":      _content_antara,
+    "police":      _content_police,
+    "suarajelata": _content_suarajelata,
+    "emsatunews":  _content_emsatunews,
+    "arahpantura": _content_arahpantura,
+}
+def feed_matches(entry: dict, terms: list[str]) -> bool:
+    """Semua kata keyword ada di judul atau ringkasan entri feed (tanpa beda huruf besar/kecil)."""
+    text = f"{entry['title']} {strip_html(entry['summary'])}".casefold()
+    return all(t in text for t in terms)
+
+def scrape_feed(site: str, keyword: str, max_articles: int, session: requests.Session,
+                since=None, until=None):
+    """
+    Discovery lewat FEEDS[site]: entri feed (di-cache, GET kondisional) difilter keyword
+    dan window tanggal secara lokal, lalu hanya halaman detail yang cocok yang di-GET.
+    Gagal jika tidak ada satu pun feed site yang bisa dibaca.
+    """
+    results, seen, errors = [], set(), []
+    terms = keyword.casefold().split()
+    window = DateWindow(since, until)
+    for url in FEEDS[site]:
         try:
-            resp = session.get(api_url, timeout=10)
-            resp.raise_for_status()
-            posts = resp.json()
+            entries = fetch_feed(session, url)
         except Exception as e:
-            print(f"[WP-REST] Gagal fetch {domain}: {e}")
+            print(f"[Feed {site}] Gagal fetch {url}: {e}")
+            errors.append(e)
             continue
-
-        for post in posts[:max_posts_per_domain]:
-            iso = post.get("date", "")
-            tanggal = parse_iso_date(iso)
-            judul = html.unescape(post.get("title", {}).get("rendered", ""))
-            link = post.get("link", "")
-            konten_html = post.get("content", {}).get("rendered", "")
-            content = BeautifulSoup(konten_html, "html.parser").get_text(separator=" ", strip=True)
-            results.append({
-                'site': domain,
-                'tanggal': tanggal,
-                'title': judul,
-                'content': content,
-                'link': link
-            })
-        print(f"[WP-REST] Selesai domain: ✅ [{domain}] ({min(len(posts), max_posts_per_domain)} posts)")
+        for entry in entries:
+            if len(results) >= max_articles:
+                break
+            link = entry["link"]
+            if not link or link in seen or not feed_matches(entry, terms):
+                continue
+            tanggal = normalize_date(entry["published"])
+            if not window.accept(tanggal):
+                continue
+            seen.add(link)
+            content = ""
+            try:
+                det = session.get(link, timeout=10, body_markers=BODY_MARKERS.get(site))
+                det.raise_for_status()
+                content = CONTENT_PARSERS[site](BeautifulSoup(det.text, "lxml"))
+            except Exception as e:
+                print(f"[Feed {site}] Gagal ambil detail {link}: {e}")
+            title = html.unescape(entry["title"])
+            results.append({'site': site, 'tanggal': tanggal, 'title': title,
+                            'content': content, 'link': link})
+            print(f"   ✅ [Feed {site} {len(results)}] {title[:50]}…")
+    if len(errors) == len(FEEDS[site]):
+        raise errors[-1]
     return results
 
+def _feed_or_search(name: str, search_func):
+    """
+    Scraper `name` dengan discovery feed. Jika feed memberi kurang dari `max_articles`,
+    sisanya diisi dari pencarian HTML; link yang sudah didapat dari feed dilewati
+    sebelum GET detail (`skip`).
+    """
+    def run(keyword: str, max_articles: int, session, since=None, until=None):
+        try:
+            rows = scrape_feed(name, keyword, max_articles, session, since, until)
+        except Exception as e:
+            print(f"[Feed {name}] Feed tidak tersedia, fallback ke pencarian HTML: {e}")
+            rows = []
+        if len(rows) >= max_articles:
+            return rows
+        if rows:
+            print(f"[Feed {name}] {len(rows)}/{max_articles} artikel dari feed, sisanya dari pencarian HTML")
+        seen = {row["link"] for row in rows}
+        rows += search_func(keyword, max_articles - len(rows), session,
+                            since=since, until=until, skip=seen)
+        return rows
+    return run
+
 # RSS Search scraper
-def scrape_rss_search(keyword: str, max_articles: int, session: requests.Session):
+def scrape_rss_search(keyword: str, max_articles: int, session: requests.Session,
+                      since=None, until=None):
     """
     Scrape RSS-search for PWMJateng and UMJ domains up to max_articles each.
     Returns list of dicts: {site, tanggal, title, content, link}
     """
+    import feedparser   # hanya dipakai di sini; tidak dibayar saat import scrapper
     results = []
     rss_domains = ["pwmjateng.com", "umj.ac.id"]
     warnings.filterwarnings("ignore", message="Unverified HTTPS request")
@@ -781,15 +1075,13 @@ def scrape_rss_search(keyword: str, max_articles: int, session: requests.Session
             print(f"[RSS] Gagal fetch {domain}: {e}")
             continue
         count = 0
+        window = DateWindow(since, until)
         for entry in feed.entries:
             if count >= max_articles:
                 break
-            raw_pub = entry.get("published", "")
-            try:
-                dt = datetime.strptime(raw_pub, '%a, %d %b %Y %H:%M:%S %z')
-                tanggal = dt.strftime('%d/%m/%Y')
-            except Exception:
-                tanggal = raw_pub
+            tanggal = normalize_date(entry.get("published", ""))
+            if not window.accept(tanggal):
+                continue
             judul = html.unescape(entry.get("title", ""))
             link = entry.get("link", "")
             isi = BeautifulSoup(entry.get("summary", ""), "html.parser").get_text(" ", strip=True)
@@ -801,29 +1093,89 @@ def scrape_rss_search(keyword: str, max_articles: int, session: requests.Session
                 'link': link
             })
             count += 1
-        print(f"[RSS] ✅ [{domain}]: {min(len(feed.entries), max_articles)} items")
+        print(f"[RSS] ✅ [{domain}]: {count} items")
     return results
 
+# Urutan site yang di-scrape oleh scrape()
+SCRAPERS = [
+    ("detik",       scrape_detik),
+    ("kompas",      scrape_kompas),
+    ("beritasatu",  scrape_beritasatu),
+    ("panturapost", scrape_panturapost),
+    ("inews",       scrape_inews),
+    ("antara",      scrape_antaranews),
+    ("tvone",       scrape_tvonenews),
+    ("police",      scrape_police),
+    ("suarajelata", scrape_suarajelata),
+    ("emsatunews",  scrape_emsatunews),
+    ("arahpantura", scrape_arahpantura),
+    ("wp_rest",     scrape_wp_rest),
+    ("rss",         scrape_rss_search),
+]
+
+def _run_scraper_isolated(name, func, keyword: str, max_articles: int, session,
+                          profiler=NULL_PROFILER, **window):
+    # satu site gagal tidak membatalkan site lain (berurutan maupun bersamaan)
+    try:
+        with profiler.span(f"site {name}", cat="site", profile=True, site=name):
+            return func(keyword, max_articles, session, **window)
+    except Exception as e:
+        print(f"[{name}] Gagal scrape: {e}")
+        return None
+
 # ✅ Fungsi scrape() global, bisa dipanggil dari app.py
-def scrape(keyword: str, max_articles: int = 5):
-    session = create_session()
-    all_data = []
-
-    all_data.extend(scrape_detik(keyword,       max_articles, session))
-    all_data.extend(scrape_kompas(keyword,      max_articles, session))
-    all_data.extend(scrape_beritasatu(keyword,  max_articles, session))
-    all_data.extend(scrape_panturapost(keyword, max_articles, session))
-    all_data.extend(scrape_inews(keyword,       max_articles, session))
-    all_data.extend(scrape_antaranews(keyword,  max_articles, session))
-    all_data.extend(scrape_tvonenews(keyword,   max_articles, session))
-    all_data.extend(scrape_police(keyword,      max_articles, session))
-    all_data.extend(scrape_suarajelata(keyword, max_articles, session))
-    all_data.extend(scrape_emsatunews(keyword,  max_articles, session))
-    all_data.extend(scrape_arahpantura(keyword, max_articles, session))
-    all_data.extend(scrape_wp_rest(keyword,     max_articles, session))
-    all_data.extend(scrape_rss_search(keyword,  max_articles, session))
-
-    return all_data
+def scrape(keyword: str, max_articles: int = 5, engine: str | None = None,
+           since=None, until=None, done_sites: dict | None = None, on_site_done=None,
+           profiler=None, discovery: str | None = None):
+    """
+    Jalankan semua scraper di SCRAPERS. Dengan engine "async" semua site berjalan
+    bersamaan di atas satu transport httpx, dan halaman detail tiap halaman listing
+    di-GET bersamaan (fetch_details); hasil tetap berurutan sesuai SCRAPERS.
+    `since`/`until` (date atau string tanggal) membatasi artikel ke window tanggal;
+    tanggal listing dicek sebelum GET detail dan paginasi berhenti lebih awal.
+    `done_sites` ({nama: rows}) berisi site yang sudah selesai (tidak di-scrape ulang);
+    `on_site_done(nama, rows)` dipanggil tiap kali satu site selesai, untuk checkpoint.
+    `profiler` (profiling.JobProfiler) merekam span + cProfile per site.
+    `discovery="feed"` memakai FEEDS untuk site yang punya feed, dengan pencarian HTML
+    sebagai fallback. Hasil gabungan diurutkan dari artikel terbaru.
+    """
+    engine = engine or SCRAPER_ENGINE
+    discovery = discovery or SCRAPER_DISCOVERY
+    if discovery not in ("search", "feed"):
+        raise ValueError(f"Discovery tidak dikenal: {discovery}")
+    profiler = profiler or NULL_PROFILER
+    window = {"since": to_date(since), "until": to_date(until)}
+    per_site = dict(done_sites or {})
+    todo = [(name, _feed_or_search(name, func) if discovery == "feed" and name in FEEDS else func)
+            for name, func in SCRAPERS if name not in per_site]
+
+    def site_done(name, rows):
+        per_site[name] = rows
+        if on_site_done:
+            on_site_done(name, rows)
+
+    if todo:
+        session = create_session(engine=engine)
+        if engine == "async":
+            try:
+                with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+                    futures = {pool.submit(_run_scraper_isolated, name, func, keyword, max_articles,
+                                           session, profiler, **window): name
+                               for name, func in todo}
+                    for fut in as_completed(futures):
+                        rows = fut.result()
+                        if rows is not None:    # site gagal tidak ditandai selesai
+                            site_done(futures[fut], rows)
+            finally:
+                session.close()
+        else:
+            for name, func in todo:
+                rows = _run_scraper_isolated(name, func, keyword, max_articles, session, profiler, **window)
+                if rows is not None:    # site gagal tidak ditandai selesai, site berikutnya tetap jalan
+                    site_done(name, rows)
+
+    rows = [row for name, _ in SCRAPERS for row in per_site.get(name, [])]
+    return sort_by_date(rows, key=lambda r: parse_date(r.get("tanggal", "")))
 
 # ✅ Program CLI tetap bisa jalan
 if __name__ == "__main__":
@@ -833,10 +1185,24 @@ if __name__ == "__main__":
     parser.add_argument('--keyword', required=True, help='Search keyword')
     parser.add_argument('--max-articles', type=int, default=20, help='Max articles per site')
     parser.add_argument('--output', default=None, help='Output CSV file name')
+    parser.add_argument('--engine', choices=['requests', 'async'], default=None,
+                        help='HTTP engine (default: env SCRAPER_ENGINE atau requests)')
+    parser.add_argument('--since', default=None, help='Hanya artikel sejak tanggal ini (YYYY-MM-DD)')
+    parser.add_argument('--until', default=None, help='Hanya artikel sampai tanggal ini (YYYY-MM-DD)')
+    parser.add_argument('--discovery', choices=['search', 'feed'], default=None,
+                        help='Discovery listing (default: env SCRAPER_DISCOVERY atau search)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Simpan profil cProfile + timeline per site ke PROFILE_DIR')
     args = parser.parse_args()
 
+    profiler = JobProfiler(f"cli_{int(time.time())}") if args.profile else None
     # 🔁 Panggil fungsi scrape() saja
-    all_data = scrape(args.keyword, args.max_articles)
+    with (profiler or NULL_PROFILER).span("scrape", profile=True, keyword=args.keyword):
+        all_data = scrape(args.keyword, args.max_articles, engine=args.engine,
+                          since=args.since, until=args.until, profiler=profiler,
+                          discovery=args.discovery)
+    if profiler:
+        print(f"✓ Profil disimpan di {profiler.save()}")
 
     output_file = args.output or f"scraped_{args.keyword}.csv"
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
@@ -0,0 +1,199 @@
+import argparse
+import datetime
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from dates import to_date
+
+# Lokasi index SQLite (FTS5) untuk semua artikel yang sudah diproses
+INDEX_PATH = os.environ.get("SEARCH_INDEX_PATH", "berita_index.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id         INTEGER PRIMARY KEY,
+    link       TEXT UNIQUE,
+    site       TEXT,
+    tanggal    TEXT,
+    tgl        TEXT,            -- ISO YYYY-MM-DD, untuk filter/sort tanggal
+    title      TEXT,
+    content    TEXT,
+    summary    TEXT,
+    kategori   TEXT,
+    keyword    TEXT,
+    indexed_at REAL
+);
+CREATE INDEX IF NOT EXISTS articles_tgl ON articles(tgl);
+CREATE INDEX IF NOT EXISTS articles_kategori ON articles(kategori);
+
+-- Semua keyword yang pernah menemukan tiap artikel (articles.keyword hanya yang pertama)
+CREATE TABLE IF NOT EXISTS article_keywords (
+    link    TEXT,
+    keyword TEXT,
+    PRIMARY KEY (link, keyword)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, summary, content)
+    VALUES (new.id, new.title, new.summary, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, content)
+    VALUES ('delete', old.id, old.title, old.summary, old.content);
+    INSERT INTO articles_fts(rowid, title, summary, content)
+    VALUES (new.id, new.title, new.summary, new.content);
+END;
+"""
+
+# Bobot BM25 per kolom FTS: title, summary, content
+BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+RESULT_FIELDS = ("site", "tanggal", "title", "summary", "kategori", "link")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(text: str) -> str:
+    """Ubah input bebas menjadi query FTS5 aman: setiap kata di-quote, digabung AND."""
+    return " ".join(f'"{tok}"' for tok in _TOKEN_RE.findall(text or ""))
+
+
+class SearchIndex:
+    """Index full-text lokal (SQLite FTS5 + ranking BM25) atas artikel yang sudah diperkaya."""
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            migrate = self._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'article_keywords'"
+                                         ).fetchone() is None
+            self._conn.executescript(SCHEMA)
+            if migrate:   # index lama: isi pasangan (link, keyword) dari keyword pertama
+                with self._conn:
+                    self._conn.execute("INSERT OR IGNORE INTO article_keywords "
+                                       "SELECT link, keyword FROM articles WHERE keyword != ''")
+
+    def add(self, art, keyword: str = "") -> tuple[bool, bool]:
+        """
+        Simpan/perbarui satu artikel (Article atau dict) berdasarkan link.
+        Mengembalikan (link baru, pasangan link × `keyword` baru). `keyword` pertama dipertahankan
+        di `articles`; semua keyword dicatat di `article_keywords`.
+        """
+        get = art.get if isinstance(art, dict) else lambda k, d="": getattr(art, k, d)
+        tanggal = get("tanggal", "")
+        tgl = to_date(tanggal)
+        row = (get("link", ""), get("site", ""), tanggal, tgl.isoformat() if tgl else None,
+               get("title", ""), get("content", ""), get("summary", ""), get("kategori", ""),
+               keyword, time.time())
+        with self._lock, self._conn:
+            is_new = self._conn.execute("SELECT 1 FROM articles WHERE link = ?",
+                                        (row[0],)).fetchone() is None
+            self._conn.execute(
+                """INSERT INTO articles (link, site, tanggal, tgl, title, content, summary,
+                                         kategori, keyword, indexed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(link) DO UPDATE SET
+                       site=excluded.site, tanggal=excluded.tanggal, tgl=excluded.tgl,
+                       title=excluded.title, content=excluded.content, summary=excluded.summary,
+                       kategori=excluded.kategori, indexed_at=excluded.indexed_at""", row)
+            new_keyword = bool(keyword) and self._conn.execute(
+                "INSERT OR IGNORE INTO article_keywords (link, keyword) VALUES (?, ?)",
+                (row[0], keyword)).rowcount == 1
+        return is_new, new_keyword
+
+    def _where(self, query: str, since, until, kategori, site):
+        clauses, params = [], []
+        match = fts_query(query)
+        if match:
+            clauses.append("articles_fts MATCH ?")
+            params.append(match)
+        since, until = to_date(since), to_date(until)
+        if since:
+            clauses.append("a.tgl >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("a.tgl <= ?")
+            params.append(until.isoformat())
+        if kategori:
+            clauses.append("a.kategori LIKE ?")
+            params.append(f"{kategori.strip()}%")
+        if site:
+            clauses.append("a.site = ?")
+            params.append(site)
+        return bool(match), (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def search(self, query: str = "", since=None, until=None, kategori: str | None = None,
+               site: str | None = None, limit: int = 50) -> list[dict]:
+        """
+        Cari artikel; dengan kata kunci hasil diurutkan BM25, tanpa kata kunci
+        diurutkan tanggal terbaru.
+        """
+        has_match, where, params = self._where(query, since, until, kategori, site)
+        if has_match:
+            score = "bm25(articles_fts, %s, %s, %s)" % BM25_WEIGHTS
+            sql = (f"SELECT a.*, {score} AS score FROM articles_fts "
+                   f"JOIN articles a ON a.id = articles_fts.rowid{where} "
+                   f"ORDER BY score LIMIT ?")
+        else:
+            sql = (f"SELECT a.*, 0.0 AS score FROM articles a{where} "
+                   f"ORDER BY a.tgl DESC LIMIT ?")
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit)).fetchall()
+        return [{**{k: r[k] for k in RESULT_FIELDS}, "score": round(abs(r["score"]), 4)} for r in rows]
+
+    def latest_date(self, query: str = "") -> datetime.date | None:
+        """Tanggal artikel terbaru yang cocok dengan `query` (untuk top-up crawl live)."""
+        has_match, where, params = self._where(query, None, None, None, None)
+        join = " JOIN articles a ON a.id = articles_fts.rowid" if has_match else ""
+        table = "articles_fts" if has_match else "articles a"
+        with self._lock:
+            row = self._conn.execute(f"SELECT MAX(a.tgl) FROM {table}{join}{where}", params).fetchone()
+        return datetime.date.fromisoformat(row[0]) if row and row[0] else None
+
+    def aggregate_rows(self) -> tuple[list[tuple], list[str]]:
+        """Semua (kategori, site, tanggal) artikel + keyword per pasangan link × keyword, untuk Aggregates."""
+        with self._lock:
+            rows = self._conn.execute("SELECT kategori, site, tanggal FROM articles").fetchall()
+            keywords = [k for (k,) in self._conn.execute("SELECT keyword FROM article_keywords")]
+        return rows, keywords
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+# CLI: cari langsung dari index tanpa crawl
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cari artikel di index lokal")
+    parser.add_argument('--query', default="", help='Kata kunci')
+    parser.add_argument('--since', default=None, help='Sejak tanggal (YYYY-MM-DD)')
+    parser.add_argument('--until', default=None, help='Sampai tanggal (YYYY-MM-DD)')
+    parser.add_argument('--kategori', default=None, help='Huruf kategori KBLI, mis. C')
+    parser.add_argument('--site', default=None, help='Nama site, mis. detik')
+    parser.add_argument('--limit', type=int, default=20, help='Jumlah hasil maksimum')
+    parser.add_argument('--index', default=INDEX_PATH, help='Path file index SQLite')
+    args = parser.parse_args()
+
+    idx = SearchIndex(args.index)
+    start = time.perf_counter()
+    hits = idx.search(args.query, args.since, args.until, args.kategori, args.site, args.limit)
+    took = (time.perf_counter() - start) * 1000
+    for i, h in enumerate(hits, 1):
+        print(f"{i:>3}. [{h['tanggal']}] [{h['kategori']}] {h['site']}: {h['title'][:70]}")
+        print(f"     {h['link']}")
+    print(f"✓ {len(hits)} hasil dari {idx.count()} artikel ({took:.1f} ms)")
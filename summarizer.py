@@ -1,8 +1,7 @@
-from groq import Groq
+from llm import get_client, stream_completion
 
-client = Groq(api_key="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")  # Ganti dengan key kamu
-
-def summarize(text):
+def summarize(text, on_token=None):
+    """Ringkas `text`; dengan `on_token`, hasil di-stream dan teks parsial dikirim ke callback."""
     if not text or not isinstance(text, str) or len(text.strip()) < 30:
         return "Teks terlalu pendek atau kosong"
 
@@ -15,10 +14,14 @@ def summarize(text):
         Ringkasan:
         """
 
-        response = client.chat.completions.create(
+        request = dict(
             model="llama3-8b-8192",  # atau "mixtral-8x7b-32768" untuk ringkasan lebih panjang
             messages=[{"role": "user", "content": prompt}]
         )
+        if on_token:
+            return stream_completion(lambda partial: on_token(partial.strip()), **request).strip()
+
+        response = get_client().chat.completions.create(**request)
 
         return response.choices[0].message.content.strip()
 